@@ -0,0 +1,328 @@
+"""
+Cached JWT authentication for the Financial API.
+Defines a SimpleJWT authentication class that remembers recently verified tokens.
+"""
+
+import copy
+import functools
+import hashlib
+import threading
+import time
+from typing import Any, NamedTuple
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.request import Request
+
+import jwt
+from cachetools import TLRUCache, TTLCache
+from rest_framework_simplejwt import settings as jwt_settings
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.tokens import Token
+from rest_framework_simplejwt.utils import aware_utcnow
+
+# Upper bound on how long a verified token is trusted without re-verification.
+# Keeps the window in which a deactivated user or revoked token is still
+# accepted short.
+AUTH_CACHE_TTL: int = 15
+AUTH_CACHE_MAXSIZE: int = 10_000
+# Users resolved from a token's user id claim are reused across tokens for
+# this long, so a fresh login does not cost another ``auth_user`` query. Saving
+# or deleting a user evicts it in the same process; other processes may keep
+# authenticating a deactivated user for up to this long.
+USER_CACHE_TTL: int = 30
+USER_CACHE_MAXSIZE: int = 5_000
+
+
+class CachedAuth(NamedTuple):
+    """Result of a successful token verification kept in the cache."""
+
+    token: Token
+    expires_at: float
+
+
+def _token_expiry(key: bytes, value: CachedAuth, now: float) -> float:
+    """Expire a cached token after ``AUTH_CACHE_TTL`` or at its ``exp``."""
+    return min(now + AUTH_CACHE_TTL, value.expires_at)
+
+
+_token_cache: "TLRUCache[bytes, CachedAuth]" = TLRUCache(
+    maxsize=AUTH_CACHE_MAXSIZE, ttu=_token_expiry, timer=time.time
+)
+_user_cache: "TTLCache[Any, Any]" = TTLCache(
+    maxsize=USER_CACHE_MAXSIZE, ttl=USER_CACHE_TTL
+)
+_token_cache_lock = threading.Lock()
+
+
+def clear_auth_cache() -> None:
+    """
+    Drop every cached token verification result and resolved user.
+
+    Examples:
+        >>> clear_auth_cache()
+    """
+    with _token_cache_lock:
+        _token_cache.clear()
+        _user_cache.clear()
+
+
+@functools.cache
+def get_verification_params() -> tuple[str, Any]:
+    """
+    Resolve the JWT algorithm and verifying key from SimpleJWT settings.
+
+    Settings do not change while the process runs, so the lookup is done once
+    and reused; it is reset when ``SIMPLE_JWT`` is overridden (e.g. in tests).
+    The key is also run through the algorithm's ``prepare_key`` here, so a PEM
+    public key is parsed into a key object once per process instead of on
+    every ``jwt.decode`` call.
+
+    Returns:
+        tuple[str, Any]: The algorithm name and the prepared key used to
+            verify signatures (the signing secret for HMAC algorithms).
+
+    Examples:
+        >>> get_verification_params()
+        ('HS256', b'...')
+    """
+    # SimpleJWT rebinds ``api_settings`` on override, so always read it from
+    # the module rather than importing the name.
+    api_settings = jwt_settings.api_settings
+    algorithm: str = api_settings.ALGORITHM
+    if algorithm.startswith("HS"):
+        key = api_settings.SIGNING_KEY
+    else:
+        key = api_settings.VERIFYING_KEY
+    return algorithm, _prepare_key(algorithm, key)
+
+
+def _prepare_key(algorithm: str, key: Any) -> Any:
+    """
+    Parse a verifying key into the object PyJWT verifies signatures with.
+
+    PyJWT accepts an already-prepared key and skips re-parsing it. When the
+    algorithm is unavailable (e.g. ``cryptography`` is not installed) or the
+    key cannot be parsed, the raw key is returned and ``jwt.decode`` reports
+    the problem as it would have without caching.
+
+    Args:
+        algorithm: The JWT algorithm name.
+        key: The raw key from settings.
+
+    Returns:
+        Any: The prepared key, or the raw key if it could not be prepared.
+    """
+    try:
+        return jwt.PyJWS().get_algorithm_by_name(algorithm).prepare_key(key)
+    except (NotImplementedError, jwt.PyJWTError, ValueError, TypeError):
+        return key
+
+
+@receiver(setting_changed)
+def _reset_verification_params(setting: str, **kwargs: Any) -> None:
+    """Forget the resolved verification parameters when SIMPLE_JWT changes."""
+    if setting == "SIMPLE_JWT":
+        get_verification_params.cache_clear()
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def _evict_cached_user(sender: Any, instance: Any, **kwargs: Any) -> None:
+    """Forget a saved or deleted user so this process looks it up again."""
+    user_id = getattr(instance, jwt_settings.api_settings.USER_ID_FIELD)
+    with _token_cache_lock:
+        _user_cache.pop(str(user_id), None)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWT authentication that skips re-verification of recently seen tokens.
+
+    Verifying a bearer token costs a signature check plus a ``User`` lookup on
+    every request. Successful verifications are kept in a bounded per-process
+    cache keyed by the SHA-256 digest of the raw token, so repeat requests
+    with the same token are served from memory for up to ``AUTH_CACHE_TTL``
+    seconds and never past the token's own ``exp`` claim: each entry's
+    lifetime is computed from its token when it is stored.
+
+    On a cache miss the token is verified with a single ``jwt.decode`` call
+    that also enforces the presence of the required claims, instead of
+    decoding and then re-checking claims on a token object.
+
+    Resolved users are cached separately, per user id, for ``USER_CACHE_TTL``
+    seconds. Saving or deleting a user evicts it from this process's cache,
+    but other processes (and ``QuerySet.update`` calls, which send no
+    signals) leave a stale entry: a deactivated user can keep authenticating
+    there for up to ``USER_CACHE_TTL`` seconds.
+
+    Examples:
+        >>> REST_FRAMEWORK = {
+        ...     "DEFAULT_AUTHENTICATION_CLASSES": (
+        ...         "api.auth_cache.CachedJWTAuthentication",
+        ...     ),
+        ... }
+    """
+
+    def authenticate(self, request: Request) -> tuple[Any, Token] | None:
+        """
+        Authenticate the request, reusing a cached verification when possible.
+
+        Args:
+            request: The incoming DRF request.
+
+        Returns:
+            tuple[User, Token] | None: The authenticated user and validated
+                token, or None when the request carries no bearer token.
+
+        Raises:
+            InvalidToken: If the token fails verification.
+            AuthenticationFailed: If the token's user is missing or inactive.
+        """
+        header = self.get_header(request)
+        if header is None:
+            return None
+
+        raw_token = self.get_raw_token(header)
+        if raw_token is None:
+            return None
+
+        key = hashlib.sha256(raw_token).digest()
+        with _token_cache_lock:
+            cached = _token_cache.get(key)
+        if cached is not None:
+            return self.get_user(cached.token), cached.token
+
+        validated_token = self.get_validated_token(raw_token)
+        user = self.get_user(validated_token)
+
+        expires_at = float(validated_token.get("exp", time.time() + AUTH_CACHE_TTL))
+        with _token_cache_lock:
+            _token_cache[key] = CachedAuth(validated_token, expires_at)
+        return user, validated_token
+
+    def get_validated_token(self, raw_token: bytes) -> Token:
+        """
+        Verify the raw token with one signature-checking decode.
+
+        Falls back to SimpleJWT's own validation when a JWKS endpoint or more
+        than one token class is configured.
+
+        Args:
+            raw_token: The encoded JWT taken from the Authorization header.
+
+        Returns:
+            Token: The validated token wrapping the decoded payload.
+
+        Raises:
+            InvalidToken: If the signature, expiry, required claims or token
+                type do not check out.
+        """
+        api_settings = jwt_settings.api_settings
+        if api_settings.JWK_URL or len(api_settings.AUTH_TOKEN_CLASSES) != 1:
+            return super().get_validated_token(raw_token)
+
+        token_class = api_settings.AUTH_TOKEN_CLASSES[0]
+        algorithm, key = get_verification_params()
+        required = [
+            claim
+            for claim in (
+                "exp",
+                api_settings.TOKEN_TYPE_CLAIM,
+                api_settings.JTI_CLAIM,
+                api_settings.USER_ID_CLAIM,
+            )
+            if claim is not None
+        ]
+        try:
+            payload = jwt.decode(
+                raw_token,
+                key,
+                algorithms=[algorithm],
+                audience=api_settings.AUDIENCE,
+                issuer=api_settings.ISSUER,
+                leeway=api_settings.LEEWAY,
+                options={
+                    "require": required,
+                    "verify_aud": api_settings.AUDIENCE is not None,
+                },
+            )
+        except jwt.ExpiredSignatureError as exc:
+            raise self._invalid_token(token_class, _("Token is expired")) from exc
+        except jwt.InvalidTokenError as exc:
+            raise self._invalid_token(token_class, _("Token is invalid")) from exc
+
+        if (
+            api_settings.TOKEN_TYPE_CLAIM is not None
+            and payload[api_settings.TOKEN_TYPE_CLAIM] != token_class.token_type
+        ):
+            raise self._invalid_token(token_class, _("Token has wrong type"))
+
+        # Wrap the already-verified payload without decoding it a second time,
+        # and without __init__, which would build a fresh payload (exp, iat,
+        # jti) only for it to be overwritten.
+        validated_token = token_class.__new__(token_class)
+        validated_token.token = raw_token  # type: ignore[assignment]
+        validated_token.current_time = aware_utcnow()
+        validated_token.payload = payload
+        return validated_token
+
+    def get_user(self, validated_token: Token) -> Any:
+        """
+        Return the token's user, reusing a recent lookup for the same user id.
+
+        SimpleJWT's own ``get_user`` queries ``auth_user`` and checks that the
+        user is active; its result is kept for ``USER_CACHE_TTL`` seconds so
+        other tokens for the same user skip the query. Cache hits are checked
+        against ``USER_AUTHENTICATION_RULE`` again, and every request gets its
+        own copy of the user, so one request never sees another's changes to
+        it. With ``CHECK_REVOKE_TOKEN`` on, users are always looked up.
+
+        Args:
+            validated_token: The verified token.
+
+        Returns:
+            User: The user the token was issued for.
+
+        Raises:
+            InvalidToken: If the token has no user id claim.
+            AuthenticationFailed: If the user is missing or inactive.
+        """
+        api_settings = jwt_settings.api_settings
+        user_id = validated_token.get(api_settings.USER_ID_CLAIM)
+        if user_id is None or api_settings.CHECK_REVOKE_TOKEN:
+            return super().get_user(validated_token)
+
+        # Claims carry the id as a string or an int depending on the issuer
+        user_id = str(user_id)
+        with _token_cache_lock:
+            user = _user_cache.get(user_id)
+        if user is None:
+            user = super().get_user(validated_token)
+            with _token_cache_lock:
+                _user_cache[user_id] = user
+        elif not api_settings.USER_AUTHENTICATION_RULE(user):
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return copy.copy(user)
+
+    @staticmethod
+    def _invalid_token(token_class: type[Token], message: Any) -> InvalidToken:
+        """Build the same error SimpleJWT raises for an unusable token."""
+        return InvalidToken(
+            {
+                "detail": _("Given token not valid for any token type"),
+                "messages": [
+                    {
+                        "token_class": token_class.__name__,
+                        "token_type": token_class.token_type,
+                        "message": message,
+                    }
+                ],
+            }
+        )
@@ -0,0 +1,52 @@
+# Generated by Django 4.2.19 on 2026-10-15 22:40
+
+from django.db import migrations, models
+from django.db.models import F
+from django.db.models.functions import Cast, Round
+
+
+def amount_to_cents(apps, schema_editor):
+    Transaction = apps.get_model("api", "Transaction")
+    Transaction.objects.update(
+        amount_cents=Cast(Round(F("amount") * 100), models.BigIntegerField())
+    )
+
+
+def cents_to_amount(apps, schema_editor):
+    Transaction = apps.get_model("api", "Transaction")
+    Transaction.objects.update(
+        amount=Cast(
+            F("amount_cents") / 100.0,
+            models.DecimalField(max_digits=10, decimal_places=2),
+        )
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0002_transaction_ordering_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transaction',
+            name='amount_cents',
+            field=models.BigIntegerField(null=True),
+        ),
+        migrations.AlterField(
+            model_name='transaction',
+            name='amount',
+            field=models.DecimalField(decimal_places=2, max_digits=10, null=True),
+        ),
+        migrations.RunPython(amount_to_cents, cents_to_amount),
+        migrations.AlterField(
+            model_name='transaction',
+            name='amount_cents',
+            field=models.BigIntegerField(),
+        ),
+        migrations.RemoveField(
+            model_name='transaction',
+            name='amount',
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 4.2.19 on 2026-10-15 23:10
+
+from django.db import migrations
+
+
+def create_date_brin(apps, schema_editor):
+    # BRIN indexes are PostgreSQL-only; other backends keep the B-tree indexes.
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS tx_date_brin "
+        "ON api_transaction USING brin (date)"
+    )
+
+
+def drop_date_brin(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS tx_date_brin")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0003_transaction_amount_cents'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_date_brin, drop_date_brin),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.19 on 2026-10-15 22:02
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0004_transaction_date_brin'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='transaction',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 4.2.19 on 2026-10-15 22:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_transaction_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='transaction',
+            index=models.Index(fields=['user', '-id'], name='tx_user_id_idx'),
+        ),
+    ]
@@ -9,6 +9,8 @@ from typing import ClassVar
 from django.contrib.auth.models import User
 from django.db import models
 
+CENT = Decimal("0.01")
+
 
 class Transaction(models.Model):
     """
@@ -16,10 +18,13 @@ class Transaction(models.Model):
 
     Attributes:
         user (User): The user associated with the transaction.
-        amount (Decimal): The amount of the transaction.
+        amount_cents (int): The amount of the transaction in cents.
+        amount (Decimal): The amount in currency units, derived from
+            ``amount_cents``.
         category (str): The type of transaction (income or expense).
         description (str, optional): Additional details about the transaction.
         date (Date): The date when the transaction was recorded.
+        updated_at (DateTime): When the transaction was last saved.
 
     Examples:
         >>> user = User.objects.get(username='john')
@@ -41,12 +46,64 @@ class Transaction(models.Model):
     user: models.ForeignKey[User, User] = models.ForeignKey(
         User, on_delete=models.CASCADE
     )
-    amount: models.DecimalField = models.DecimalField(max_digits=10, decimal_places=2)
+    amount_cents: models.BigIntegerField = models.BigIntegerField()
     category: models.CharField = models.CharField(
         max_length=10, choices=CATEGORY_CHOICES
     )
     description: models.TextField = models.TextField(blank=True, null=True)
     date: models.DateField = models.DateField(auto_now_add=True)
+    updated_at: models.DateTimeField = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        """Model configuration."""
+
+        ordering: ClassVar[list[str]] = ["-date", "-id"]
+        # On PostgreSQL, migration 0004 also adds a BRIN index on ``date``
+        # (tx_date_brin) for cross-user date-range scans; it is kept out of
+        # Meta because other backends cannot create it.
+        indexes: ClassVar[list[models.Index]] = [
+            models.Index(fields=["user", "-date", "-id"], name="tx_user_date_idx"),
+            # Backs the API listing's cursor, which pages on the unique ``id``
+            models.Index(fields=["user", "-id"], name="tx_user_id_idx"),
+        ]
+
+    @property
+    def amount(self) -> Decimal | None:
+        """
+        Return the amount in currency units.
+
+        The column stores integer cents so the database driver and ORM stay
+        on the integer path; the Decimal is only built when asked for.
+
+        Returns:
+            Decimal | None: The amount with two decimal places, or None if
+                no amount has been set.
+
+        Examples:
+            >>> Transaction(amount_cents=10050).amount
+            Decimal('100.50')
+        """
+        if self.amount_cents is None:
+            return None
+        return Decimal(self.amount_cents).scaleb(-2)
+
+    @amount.setter
+    def amount(self, value: Decimal | int | float | str | None) -> None:
+        """
+        Set the amount from a value in currency units.
+
+        Args:
+            value: The amount, rounded to the nearest cent, or None.
+
+        Examples:
+            >>> transaction = Transaction(amount=Decimal('100.50'))
+            >>> transaction.amount_cents
+            10050
+        """
+        if value is None:
+            self.amount_cents = None
+        else:
+            self.amount_cents = int(Decimal(str(value)).quantize(CENT).scaleb(2))
 
     def __str__(self) -> str:
         """
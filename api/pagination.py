@@ -0,0 +1,36 @@
+"""
+Custom pagination classes for the Financial API.
+Defines keyset (cursor) pagination for transaction listings.
+"""
+
+from rest_framework.pagination import CursorPagination
+
+
+class TransactionCursorPagination(CursorPagination):
+    """
+    Keyset pagination for a user's transaction log.
+
+    Pages are addressed by an opaque cursor instead of an offset. DRF builds
+    the cursor from the first ordering field alone, so that field must be
+    unique: on ``date`` every row from the same day would share a position,
+    and DRF falls back to an offset capped at ``offset_cutoff`` rows. Ids grow
+    with insertion, so ``-id`` is newest first and each page seeks into the
+    ``(user, -id)`` index.
+
+    Attributes:
+        page_size: Default number of transactions per page.
+        page_size_query_param: Query parameter clients may use to change the
+            page size.
+        max_page_size: Upper bound for client-requested page sizes.
+        ordering: Unique, index-backed ordering used to build the cursor.
+
+    Examples:
+        >>> paginator = TransactionCursorPagination()
+        >>> paginator.ordering
+        ('-id',)
+    """
+
+    page_size: int = 50
+    page_size_query_param: str = "page_size"
+    max_page_size: int = 500
+    ordering: tuple[str, ...] = ("-id",)
@@ -3,23 +3,39 @@ Serializers for the Financial API.
 Defines the TransactionSerializer for API data serialization.
 """
 
-from typing import Any, Optional
+from decimal import Decimal
+from typing import Any, ClassVar, Optional
+
+from django.db import transaction
 
 from rest_framework import serializers
 
 from api.models import Transaction
+from core.serializers import CachedModelSerializer
 from core.types import APIRequest, SerializerData
 
 
-class TransactionSerializer(serializers.ModelSerializer[Transaction]):
+class TransactionSerializer(CachedModelSerializer[Transaction]):
     """
     Serializer for the Transaction model.
 
     Converts Transaction model instances into JSON format and vice versa.
     The user field is read-only and automatically set to the authenticated user.
+    The field map is built once per class and copied for each instance.
+    ``amount`` is exposed as a two-place decimal and stored as integer cents.
+
+    Every field is declared explicitly, so building the field map never goes
+    through ``ModelSerializer``'s model introspection and field-class lookup.
 
     Attributes:
-        Meta: Serializer configuration including model, fields, and read-only fields.
+        id: Read-only primary key.
+        amount: Transaction amount with two decimal places.
+        category: Either ``income`` or ``expense``.
+        description: Optional free-text description.
+        date: Read-only creation date.
+        user: Read-only owner, set from the request.
+        values_fields: Columns ``represent_values`` expects in a values() row.
+        Meta: Serializer configuration including model and fields.
 
     Examples:
         >>> serializer = TransactionSerializer(data={
@@ -32,12 +48,62 @@ class TransactionSerializer(serializers.ModelSerializer[Transaction]):
         >>> transaction = serializer.save()
     """
 
+    id = serializers.IntegerField(read_only=True)
+    amount = serializers.DecimalField(max_digits=10, decimal_places=2)
+    category = serializers.ChoiceField(choices=Transaction.CATEGORY_CHOICES)
+    description = serializers.CharField(
+        required=False,
+        allow_blank=True,
+        allow_null=True,
+        style={"base_template": "textarea.html"},
+    )
+    date = serializers.DateField(read_only=True)
+    user = serializers.PrimaryKeyRelatedField(read_only=True)
+    values_fields: ClassVar[tuple[str, ...]] = (
+        "id",
+        "amount_cents",
+        "category",
+        "description",
+        "date",
+        "user_id",
+    )
+
     class Meta:
         """Serializer configuration."""
 
         model = Transaction
-        fields = ["id", "amount", "category", "description", "date", "user"]
-        read_only_fields = ["id", "date", "user"]
+        fields = ("id", "amount", "category", "description", "date", "user")
+
+    @classmethod
+    def represent_values(cls, row: dict[str, Any]) -> SerializerData:
+        """
+        Render a ``QuerySet.values(*values_fields)`` row like ``data`` would.
+
+        Read-only listings fetch plain dicts instead of model instances and
+        skip the per-field ``to_representation`` walk; this produces the same
+        output shape as serializing the equivalent instance.
+
+        Args:
+            row: A dict with the keys named in ``values_fields``.
+
+        Returns:
+            SerializerData: The serialized transaction.
+
+        Examples:
+            >>> rows = Transaction.objects.values(
+            ...     *TransactionSerializer.values_fields
+            ... )
+            >>> TransactionSerializer.represent_values(rows[0])["amount"]
+            '100.50'
+        """
+        return {
+            "id": row["id"],
+            "amount": str(Decimal(row["amount_cents"]).scaleb(-2)),
+            "category": row["category"],
+            "description": row["description"],
+            "date": row["date"].isoformat(),
+            "user": row["user_id"],
+        }
 
     def create(self, validated_data: SerializerData) -> Transaction:
         """
@@ -45,6 +111,8 @@ class TransactionSerializer(serializers.ModelSerializer[Transaction]):
 
         The user is automatically assigned from the request context,
         preventing users from creating transactions for other users.
+        The write runs in its own atomic block, since requests are not
+        wrapped in a transaction (``ATOMIC_REQUESTS`` is off).
 
         Args:
             validated_data: Validated transaction data from the request.
@@ -70,4 +138,5 @@ class TransactionSerializer(serializers.ModelSerializer[Transaction]):
         request: APIRequest | None = self.context.get("request")
         if request and hasattr(request, "user"):
             validated_data["user"] = request.user
-        return super().create(validated_data)
+        with transaction.atomic():
+            return super().create(validated_data)
@@ -3,10 +3,209 @@ Custom throttling classes for the Financial API.
 Defines rate limiting for transaction-related API requests.
 """
 
-from rest_framework.throttling import AnonRateThrottle, UserRateThrottle
+import functools
+from typing import TYPE_CHECKING, Any
 
+from django.core.cache import BaseCache, caches
 
-class TransactionUserThrottle(UserRateThrottle):
+from rest_framework.request import Request
+from rest_framework.throttling import (
+    AnonRateThrottle,
+    SimpleRateThrottle,
+    UserRateThrottle,
+)
+
+if TYPE_CHECKING:  # rest_framework.views reads DEFAULT_THROTTLE_CLASSES on import
+    from rest_framework.views import APIView
+
+try:
+    from django_redis import get_redis_connection
+except ImportError:  # without django-redis, throttles use the Django cache
+    get_redis_connection = None
+
+# Token bucket, evaluated atomically on the Redis server. The bucket holds up
+# to ARGV[1] tokens and refills at ARGV[2] tokens per second, based on the
+# elapsed time since it was last touched (Redis' own clock, so every worker
+# agrees). Each request takes one token. Returns {1, 0} when allowed, or
+# {0, seconds until the next token} when not; the wait is a string because
+# Redis truncates Lua numbers to integers.
+REDIS_TOKEN_BUCKET_SCRIPT = """
+local capacity = tonumber(ARGV[1])
+local refill_rate = tonumber(ARGV[2])
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'updated_at')
+local tokens = tonumber(bucket[1]) or capacity
+local updated_at = tonumber(bucket[2]) or now
+tokens = math.min(capacity, tokens + math.max(0, now - updated_at) * refill_rate)
+
+local allowed = 0
+local wait = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+else
+    wait = (1 - tokens) / refill_rate
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'updated_at', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / refill_rate))
+return {allowed, tostring(wait)}
+"""
+
+
+# Seconds per rate period, keyed by the period's first letter as DRF reads it
+# (so "minute", "min" and "m" are all accepted).
+RATE_PERIODS: dict[str, int] = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+@functools.lru_cache(maxsize=32)
+def parse_rate(rate: str | None) -> tuple[int | None, int | None]:
+    """
+    Parse a rate string such as ``"500/day"`` once and remember the result.
+
+    Throttles are instantiated on every request and DRF parses the rate in
+    ``__init__``; rates are class constants, so the result is cached.
+
+    Args:
+        rate: The rate in ``"num_requests/period"`` format, or None.
+
+    Returns:
+        tuple[int | None, int | None]: The allowed number of requests and the
+            period length in seconds.
+
+    Examples:
+        >>> parse_rate("500/day")
+        (500, 86400)
+    """
+    if rate is None:
+        return None, None
+    num, period = rate.split("/")
+    return int(num), RATE_PERIODS[period[0]]
+
+
+class RedisRateThrottle(SimpleRateThrottle):
+    """
+    Token-bucket rate throttle evaluated with a single atomic Redis call.
+
+    DRF's ``SimpleRateThrottle`` reads a list of timestamps from the cache,
+    trims it in Python and writes it back on every request: two round-trips,
+    O(rate) work and a read-modify-write race between workers. When the
+    throttle cache is a django-redis cache this class instead runs one Lua
+    script implementing a token bucket: ``num_requests`` tokens refilled
+    continuously over ``duration``, so limits recover smoothly instead of at
+    window boundaries. Other cache backends keep DRF's default algorithm on
+    the same cache.
+
+    Attributes:
+        cache_alias: Name of the cache holding throttle state.
+
+    Examples:
+        >>> class BurstThrottle(RedisRateThrottle, UserRateThrottle):
+        ...     rate = "60/minute"
+    """
+
+    cache_alias: str = "throttle"
+    redis_wait: float | None = None
+
+    @property
+    def cache(self) -> BaseCache:  # type: ignore[override]
+        """Return the cache DRF's fallback algorithm stores history in."""
+        return caches[self.cache_alias]
+
+    def parse_rate(self, rate: str | None) -> tuple[int | None, int | None]:
+        """Return the cached parse of ``rate``; see :func:`parse_rate`."""
+        return parse_rate(rate)
+
+    def get_redis(self) -> Any:
+        """
+        Return a raw Redis client for the throttle cache, if there is one.
+
+        Returns:
+            Redis | None: The client, or None when django-redis is not
+                installed or the cache is not a django-redis cache.
+        """
+        if get_redis_connection is None:
+            return None
+        try:
+            return get_redis_connection(self.cache_alias)
+        except NotImplementedError:
+            return None
+
+    def allow_request(self, request: Request, view: "APIView") -> bool:
+        """
+        Take a token for the request and decide whether it may proceed.
+
+        Args:
+            request: The incoming DRF request.
+            view: The view being accessed.
+
+        Returns:
+            bool: True if the request should be allowed.
+        """
+        redis = self.get_redis()
+        if redis is None:
+            return super().allow_request(request, view)
+
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        allowed, wait = redis.eval(
+            REDIS_TOKEN_BUCKET_SCRIPT,
+            1,
+            self.key,
+            self.num_requests,
+            self.num_requests / self.duration,
+        )
+        if int(allowed):
+            return True
+        self.redis_wait = float(wait)
+        return False
+
+    def wait(self) -> float | None:
+        """
+        Return the recommended number of seconds to wait before retrying.
+
+        Returns:
+            float | None: Seconds until the next token is available.
+        """
+        if self.redis_wait is not None:
+            return self.redis_wait
+        return super().wait()
+
+
+class UserThrottle(RedisRateThrottle, UserRateThrottle):
+    """
+    Throttle for authenticated users at the ``user`` scope rate.
+
+    The rate comes from ``DEFAULT_THROTTLE_RATES["user"]``. Not applied by
+    default; views opt in through ``throttle_classes``.
+
+    Examples:
+        >>> UserThrottle().scope
+        'user'
+    """
+
+
+class AnonThrottle(RedisRateThrottle, AnonRateThrottle):
+    """
+    Throttle for anonymous clients at the ``anon`` scope rate.
+
+    The rate comes from ``DEFAULT_THROTTLE_RATES["anon"]``. Not applied by
+    default; views opt in through ``throttle_classes``.
+
+    Examples:
+        >>> AnonThrottle().scope
+        'anon'
+    """
+
+
+class TransactionUserThrottle(RedisRateThrottle, UserRateThrottle):
     """
     Custom throttle for authenticated users.
 
@@ -25,7 +224,7 @@ class TransactionUserThrottle(UserRateThrottle):
     rate: str = "500/day"
 
 
-class TransactionAnonThrottle(AnonRateThrottle):
+class TransactionAnonThrottle(RedisRateThrottle, AnonRateThrottle):
     """
     Custom throttle for anonymous users.
 
@@ -3,17 +3,25 @@ API views for the Financial API.
 Defines the TransactionViewSet to handle CRUD operations for transactions.
 """
 
+import hashlib
 from typing import ClassVar
 
-from django.db.models import QuerySet
+from django.db.models import Count, Max, QuerySet
+from django.utils.cache import get_conditional_response
+from django.utils.http import quote_etag
 
-from rest_framework import viewsets
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
 from rest_framework.permissions import BasePermission, IsAuthenticated
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.throttling import AnonRateThrottle, BaseThrottle
 
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 
 from api.models import Transaction
+from api.pagination import TransactionCursorPagination
 from api.serializers import TransactionSerializer
 from api.throttling import TransactionAnonThrottle, TransactionUserThrottle
 
@@ -32,9 +40,17 @@ class TransactionViewSet(viewsets.ModelViewSet[Transaction]):
     - Authenticated users: 500 requests/day
     - Anonymous users: 5 requests/minute
 
+    **Conditional requests:** Listings carry an `ETag` header; send it back
+    as `If-None-Match` to get `304 Not Modified` when nothing changed.
+
+    **Pagination:** Listings are cursor-paginated, newest first. Follow the
+    `next`/`previous` links to walk the log; `page_size` (max 500) adjusts
+    the page length.
+
     **Endpoints:**
     - `GET /api/transactions/` - List all user's transactions
     - `POST /api/transactions/` - Create a new transaction
+    - `POST /api/transactions/bulk/` - Create many transactions in one request
     - `GET /api/transactions/{id}/` - Retrieve a specific transaction
     - `PUT /api/transactions/{id}/` - Update a transaction (full)
     - `PATCH /api/transactions/{id}/` - Update a transaction (partial)
@@ -55,46 +71,131 @@ class TransactionViewSet(viewsets.ModelViewSet[Transaction]):
 
     queryset = Transaction.objects.all()
     serializer_class = TransactionSerializer
+    queryset_fields: ClassVar[tuple[str, ...]] = (
+        "id",
+        "amount_cents",
+        "category",
+        "description",
+        "date",
+        "user_id",
+        "user__username",
+    )
+    # Actions whose objects are only rendered, never saved; only these load
+    # the narrowed ``queryset_fields`` projection.
+    read_only_actions: ClassVar[frozenset[str]] = frozenset({"list", "retrieve"})
     permission_classes: ClassVar[list[type[BasePermission]]] = [IsAuthenticated]
     throttle_classes: ClassVar[
         list[type[TransactionUserThrottle] | type[TransactionAnonThrottle]]
     ] = [TransactionUserThrottle, TransactionAnonThrottle]
+    pagination_class = TransactionCursorPagination
+    bulk_create_max_items: ClassVar[int] = 1000
+    bulk_create_batch_size: ClassVar[int] = 500
 
     @swagger_auto_schema(
-        operation_description="List all transactions for the authenticated user.",
+        operation_description=(
+            "List the authenticated user's transactions, newest first. "
+            "Results are cursor-paginated; follow the `next` link for older rows."
+        ),
         operation_summary="List user transactions",
         responses={
             200: openapi.Response(
-                description="List of transactions",
+                description="Paginated list of transactions",
                 schema=TransactionSerializer(many=True),
                 examples={
-                    "application/json": [
-                        {
-                            "id": 1,
-                            "amount": "100.50",
-                            "category": "income",
-                            "description": "Freelance payment",
-                            "date": "2025-10-25T12:00:00Z",
-                            "user": 1,
-                        },
-                        {
-                            "id": 2,
-                            "amount": "50.00",
-                            "category": "expense",
-                            "description": "Groceries",
-                            "date": "2025-10-24T10:30:00Z",
-                            "user": 1,
-                        },
-                    ]
+                    "application/json": {
+                        "next": (
+                            "http://localhost:8000/api/transactions/?cursor=cD0yMDI1"
+                        ),
+                        "previous": None,
+                        "results": [
+                            {
+                                "id": 2,
+                                "amount": "50.00",
+                                "category": "expense",
+                                "description": "Groceries",
+                                "date": "2025-10-25",
+                                "user": 1,
+                            },
+                            {
+                                "id": 1,
+                                "amount": "100.50",
+                                "category": "income",
+                                "description": "Freelance payment",
+                                "date": "2025-10-24",
+                                "user": 1,
+                            },
+                        ],
+                    }
                 },
             ),
+            304: "Not Modified - The listing matches the client's ETag",
             401: "Unauthorized - Authentication required",
         },
         tags=["transactions"],
     )
     def list(self, request, *args, **kwargs):  # type: ignore[no-untyped-def]
-        """List all transactions for the authenticated user."""
-        return super().list(request, *args, **kwargs)
+        """
+        List all transactions for the authenticated user.
+
+        The listing is read-only, so rows are fetched with ``.values()`` and
+        rendered by ``TransactionSerializer.represent_values`` instead of
+        building a model instance and a serializer field walk per row.
+
+        A cheap aggregate over the user's rows yields an ETag; conditional
+        requests that still match get a 304 without fetching or rendering any
+        rows. No Last-Modified is sent: the latest ``updated_at`` is unchanged
+        by deletes and HTTP dates only resolve whole seconds, so
+        If-Modified-Since could answer 304 for a listing that changed.
+        """
+        queryset = self.filter_queryset(self.get_queryset())
+        etag = self.get_list_etag(queryset)
+        not_modified = get_conditional_response(request._request, etag=etag)
+        if not_modified is not None:
+            return not_modified
+
+        rows_queryset = queryset.values(*TransactionSerializer.values_fields)
+        page = self.paginate_queryset(rows_queryset)
+        rows = rows_queryset if page is None else page
+        data = [TransactionSerializer.represent_values(row) for row in rows]
+        response = Response(data) if page is None else self.get_paginated_response(data)
+        response["ETag"] = etag
+        return response
+
+    def get_list_etag(self, queryset: "QuerySet[Transaction, Transaction]") -> str:
+        """
+        Compute the ETag for a transaction listing.
+
+        The ETag covers the row count, the highest id and the latest
+        ``updated_at``, so creates, deletes and edits all change it, plus the
+        requested path and response format so each page and representation
+        gets its own tag.
+
+        Args:
+            queryset: The user's filtered transactions.
+
+        Returns:
+            str: The quoted ETag.
+
+        Examples:
+            >>> viewset.get_list_etag(queryset)
+            '"3f2c..."'
+        """
+        state = queryset.aggregate(
+            count=Count("id"), last_id=Max("id"), last_modified=Max("updated_at")
+        )
+        fingerprint = ":".join(
+            str(part)
+            for part in (
+                self.request.user.pk,
+                state["count"],
+                state["last_id"],
+                state["last_modified"],
+                self.request.get_full_path(),
+                self.request.accepted_renderer.format,
+            )
+        )
+        digest = hashlib.md5(fingerprint.encode(), usedforsecurity=False).hexdigest()
+        return quote_etag(digest)
 
     @swagger_auto_schema(
         operation_description=(
@@ -148,6 +249,64 @@ class TransactionViewSet(viewsets.ModelViewSet[Transaction]):
         """Create a new transaction."""
         return super().create(request, *args, **kwargs)
 
+    @swagger_auto_schema(
+        operation_description=(
+            "Create many transactions in one request, e.g. when importing a "
+            "bank statement. The body is a JSON array of transactions; the "
+            "whole batch is validated first and nothing is saved if any item "
+            "is invalid. At most 1000 items per request."
+        ),
+        operation_summary="Bulk create transactions",
+        request_body=TransactionSerializer(many=True),
+        responses={
+            201: openapi.Response(
+                description="Transactions created successfully",
+                schema=TransactionSerializer(many=True),
+            ),
+            400: "Bad Request - Invalid data",
+            401: "Unauthorized - Authentication required",
+        },
+        tags=["transactions"],
+    )
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk(self, request: Request) -> Response:
+        """
+        Create a batch of transactions with a single ``bulk_create``.
+
+        The payload is validated as a whole through a ``many=True`` serializer,
+        then inserted in batches, skipping the per-row ``save()`` and
+        serializer setup that N separate POSTs would incur.
+
+        Args:
+            request: The incoming request whose body is a list of transactions.
+
+        Returns:
+            Response: The created transactions with HTTP 201.
+
+        Examples:
+            >>> client.post(
+            ...     "/api/transactions/bulk/",
+            ...     [{"amount": "10.00", "category": "expense"}],
+            ...     format="json",
+            ... ).status_code
+            201
+        """
+        serializer = self.get_serializer(
+            data=request.data, many=True, max_length=self.bulk_create_max_items
+        )
+        serializer.is_valid(raise_exception=True)
+        transactions = Transaction.objects.bulk_create(
+            [
+                Transaction(user=request.user, **item)
+                for item in serializer.validated_data
+            ],
+            batch_size=self.bulk_create_batch_size,
+        )
+        return Response(
+            self.get_serializer(transactions, many=True).data,
+            status=status.HTTP_201_CREATED,
+        )
+
     @swagger_auto_schema(
         operation_description=(
             "Retrieve a specific transaction by ID. "
@@ -228,12 +387,42 @@ class TransactionViewSet(viewsets.ModelViewSet[Transaction]):
         """Delete a transaction."""
         return super().destroy(request, *args, **kwargs)
 
+    def get_throttles(self) -> "list[BaseThrottle]":
+        """
+        Instantiate only the throttles that can apply to this request.
+
+        Anonymous-rate throttles never limit authenticated users (their cache
+        key is None), so they are not instantiated for them at all.
+
+        Returns:
+            list[BaseThrottle]: Throttle instances to check for this request.
+
+        Examples:
+            >>> viewset.request.user.is_authenticated
+            True
+            >>> [type(t).__name__ for t in viewset.get_throttles()]
+            ['TransactionUserThrottle']
+        """
+        user = getattr(self.request, "user", None)
+        if user is None or not user.is_authenticated:
+            return super().get_throttles()
+        return [
+            throttle()
+            for throttle in self.throttle_classes
+            if not issubclass(throttle, AnonRateThrottle)
+        ]
+
     def get_queryset(self) -> "QuerySet[Transaction, Transaction]":
         """
         Return transactions that belong to the authenticated user.
 
         This method ensures that users can only access their own transactions,
-        providing data isolation and security.
+        providing data isolation and security. The related user row is joined
+        in the same query so rendering a transaction never triggers a
+        per-row ``auth_user`` lookup. For reads, the projection is narrowed to
+        the columns the serializer actually renders; writes load full rows,
+        because ``save()`` on a deferred instance only writes the loaded
+        fields and would skip e.g. ``updated_at``.
 
         For schema generation (swagger_fake_view), returns all transactions
         to allow proper API documentation generation.
@@ -253,4 +442,9 @@ class TransactionViewSet(viewsets.ModelViewSet[Transaction]):
             return Transaction.objects.all()
 
         # Return user-filtered queryset for normal requests
-        return Transaction.objects.filter(user=self.request.user)
+        queryset = Transaction.objects.select_related("user").filter(
+            user=self.request.user
+        )
+        if self.action in self.read_only_actions:
+            queryset = queryset.only(*self.queryset_fields)
+        return queryset
@@ -3,8 +3,10 @@ Django settings for configuring the Financial API.
 Includes settings for JWT authentication and security configurations.
 """
 
+import functools
 import os
 from pathlib import Path
+from typing import Any
 
 from django.core.exceptions import ImproperlyConfigured
 
@@ -14,6 +16,12 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+@functools.cache
+def _env(name: str, default: Any = None) -> Any:
+    """Return environment variable ``name``, read once per name and default."""
+    return os.environ.get(name, default)
+
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -22,7 +30,7 @@ BASE_DIR = Path(__file__).resolve().parent.parent
 # ============================================================================
 
 # SECURITY WARNING: keep the secret key used in production secret!
-SECRET_KEY = os.getenv("SECRET_KEY")
+SECRET_KEY = _env("SECRET_KEY")
 if not SECRET_KEY:
     raise ImproperlyConfigured(
         "SECRET_KEY environment variable must be set. "
@@ -30,20 +38,16 @@ if not SECRET_KEY:
     )
 
 # SECURITY WARNING: don't run with debug turned on in production!
-DEBUG = os.getenv("DEBUG", "False") == "True"
+DEBUG = _env("DEBUG", "False") == "True"
 
-ALLOWED_HOSTS = (
-    os.getenv("ALLOWED_HOSTS", "").split(",") if os.getenv("ALLOWED_HOSTS") else []
-)
+ALLOWED_HOSTS = _env("ALLOWED_HOSTS", "").split(",") if _env("ALLOWED_HOSTS") else []
 
 # HTTPS/SSL Settings (Enable in production)
-SECURE_SSL_REDIRECT = os.getenv("SECURE_SSL_REDIRECT", "False") == "True"
+SECURE_SSL_REDIRECT = _env("SECURE_SSL_REDIRECT", "False") == "True"
 SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
 
 # HTTP Strict Transport Security (HSTS)
-SECURE_HSTS_SECONDS = int(
-    os.getenv("SECURE_HSTS_SECONDS", "0" if DEBUG else "31536000")
-)
+SECURE_HSTS_SECONDS = int(_env("SECURE_HSTS_SECONDS", "0" if DEBUG else "31536000"))
 SECURE_HSTS_INCLUDE_SUBDOMAINS = not DEBUG
 SECURE_HSTS_PRELOAD = not DEBUG
 
@@ -62,9 +66,7 @@ X_FRAME_OPTIONS = "DENY"
 
 # CSRF Trusted Origins (for CORS)
 CSRF_TRUSTED_ORIGINS = (
-    os.getenv("CSRF_TRUSTED_ORIGINS", "").split(",")
-    if os.getenv("CSRF_TRUSTED_ORIGINS")
-    else []
+    _env("CSRF_TRUSTED_ORIGINS", "").split(",") if _env("CSRF_TRUSTED_ORIGINS") else []
 )
 
 # ============================================================================
@@ -83,16 +85,21 @@ INSTALLED_APPS = [
     "rest_framework_simplejwt",
     "drf_yasg",
     # Local apps
+    "core",
     "api",
 ]
 
+# Session, CSRF, auth and message middleware are only needed by the admin;
+# the core.middleware variants skip them for every other path, so JWT API
+# requests don't pay for them.
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
-    "django.contrib.sessions.middleware.SessionMiddleware",
+    "whitenoise.middleware.WhiteNoiseMiddleware",
+    "core.middleware.AdminSessionMiddleware",
     "django.middleware.common.CommonMiddleware",
-    "django.middleware.csrf.CsrfViewMiddleware",
-    "django.contrib.auth.middleware.AuthenticationMiddleware",
-    "django.contrib.messages.middleware.MessageMiddleware",
+    "core.middleware.AdminCsrfViewMiddleware",
+    "core.middleware.AdminAuthenticationMiddleware",
+    "core.middleware.AdminMessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
@@ -121,10 +128,22 @@ WSGI_APPLICATION = "config.wsgi.application"
 # Database
 # ============================================================================
 
+# Seconds a connection is kept open between requests; 0 closes it after
+# every request, as Django does by default.
+DB_CONN_MAX_AGE = int(_env("DB_CONN_MAX_AGE", "600"))
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": BASE_DIR / "db.sqlite3",
+        # Keep connections open between requests instead of reconnecting
+        # (and re-doing the TLS handshake on PostgreSQL) for every request;
+        # health checks drop connections the server has closed meanwhile.
+        "CONN_MAX_AGE": DB_CONN_MAX_AGE,
+        "CONN_HEALTH_CHECKS": True,
+        # Don't wrap every request in a transaction; writes that need one
+        # open it themselves (see TransactionSerializer.create).
+        "ATOMIC_REQUESTS": False,
     }
 }
 
@@ -132,13 +151,48 @@ DATABASES = {
 # DATABASES = {
 #     "default": {
 #         "ENGINE": "django.db.backends.postgresql",
-#         "NAME": os.getenv("DB_NAME"),
-#         "USER": os.getenv("DB_USER"),
-#         "PASSWORD": os.getenv("DB_PASSWORD"),
-#         "HOST": os.getenv("DB_HOST", "localhost"),
-#         "PORT": os.getenv("DB_PORT", "5432"),
+#         "NAME": _env("DB_NAME"),
+#         "USER": _env("DB_USER"),
+#         "PASSWORD": _env("DB_PASSWORD"),
+#         "HOST": _env("DB_HOST", "localhost"),
+#         "PORT": _env("DB_PORT", "5432"),
+#         "CONN_MAX_AGE": DB_CONN_MAX_AGE,
+#         "CONN_HEALTH_CHECKS": True,
 #     }
 # }
+#
+# With many gunicorn workers, put PgBouncer (transaction pooling mode) in
+# front of PostgreSQL so persistent connections don't exhaust max_connections.
+# On Django 5.1+ with psycopg 3, the built-in pool is an alternative: set
+# "CONN_MAX_AGE": 0 and "OPTIONS": {"pool": {"min_size": 4, "max_size": 20}}.
+
+
+# ============================================================================
+# Cache Configuration
+# ============================================================================
+
+# Per-process in-memory cache; backs the cached API schema.
+# Cleared on restart, so a deploy always serves a freshly generated schema.
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "financial-api",
+    },
+    # Throttle state must be shared by every worker for limits to hold, so
+    # production points this at Redis via REDIS_URL; throttles then run a
+    # single atomic token-bucket script per request (see api/throttling.py).
+    "throttle": (
+        {
+            "BACKEND": "django_redis.cache.RedisCache",
+            "LOCATION": _env("REDIS_URL"),
+        }
+        if _env("REDIS_URL")
+        else {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+            "LOCATION": "throttle",
+        }
+    ),
+}
 
 
 # ============================================================================
@@ -187,6 +241,18 @@ STATICFILES_DIRS = [
     os.path.join(BASE_DIR, "static"),
 ]
 
+# collectstatic writes content-hashed, pre-compressed (gzip/brotli) copies of
+# every asset; WhiteNoise serves them with far-future cache headers and picks
+# the variant matching Accept-Encoding without compressing per request.
+STORAGES = {
+    "default": {
+        "BACKEND": "django.core.files.storage.FileSystemStorage",
+    },
+    "staticfiles": {
+        "BACKEND": "whitenoise.storage.CompressedManifestStaticFilesStorage",
+    },
+}
+
 # ============================================================================
 # Default Primary Key Field Type
 # ============================================================================
@@ -198,16 +264,67 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # ============================================================================
 
 REST_FRAMEWORK = {
-    "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
-    ),
+    "DEFAULT_AUTHENTICATION_CLASSES": ("api.auth_cache.CachedJWTAuthentication",),
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.IsAuthenticated",),
+    # The API only accepts JSON bodies; form and multipart parsing is never
+    # needed, so it isn't offered.
+    "DEFAULT_PARSER_CLASSES": ("rest_framework.parsers.JSONParser",),
+    "DEFAULT_RENDERER_CLASSES": (
+        "api.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ),
+    "TEST_REQUEST_DEFAULT_FORMAT": "json",
     "DEFAULT_THROTTLE_RATES": {
         "anon": "10/minute",  # Limit anonymous requests
         "user": "1000/day",  # Limit authenticated users
     },
 }
 
+# Reject request bodies over 1 MB before they are read into memory; even a
+# full bulk import stays well below this.
+DATA_UPLOAD_MAX_MEMORY_SIZE = 1_048_576
+FILE_UPLOAD_MAX_MEMORY_SIZE = 1_048_576
+
+# ============================================================================
+# Simple JWT Configuration
+# ============================================================================
+
+# Pin the algorithm and keys explicitly. api.auth_cache resolves and prepares
+# the verifying key once per process from these values and caches verified
+# tokens for a few seconds (never past their exp).
+#
+# HS256 (the default) signs with SECRET_KEY. For tokens verified by other
+# services, use an asymmetric algorithm; EdDSA (Ed25519) verifies several
+# times faster than RS256 and produces 64-byte signatures. Generate keys with:
+#   openssl genpkey -algorithm ed25519 -out keys/jwt_private.pem
+#   openssl pkey -in keys/jwt_private.pem -pubout -out keys/jwt_public.pem
+JWT_ALGORITHM = _env("JWT_ALGORITHM", "HS256")
+if JWT_ALGORITHM.startswith("HS"):
+    JWT_SIGNING_KEY = SECRET_KEY
+    JWT_VERIFYING_KEY = ""
+else:
+    _jwt_private_key_file = Path(
+        _env("JWT_PRIVATE_KEY_FILE", BASE_DIR / "keys" / "jwt_private.pem")
+    )
+    _jwt_public_key_file = Path(
+        _env("JWT_PUBLIC_KEY_FILE", BASE_DIR / "keys" / "jwt_public.pem")
+    )
+    try:
+        JWT_SIGNING_KEY = _jwt_private_key_file.read_text()
+        JWT_VERIFYING_KEY = _jwt_public_key_file.read_text()
+    except OSError as exc:
+        raise ImproperlyConfigured(
+            f"JWT_ALGORITHM={JWT_ALGORITHM} needs a key pair; could not read "
+            f"{exc.filename}. Set JWT_PRIVATE_KEY_FILE and JWT_PUBLIC_KEY_FILE."
+        ) from exc
+
+SIMPLE_JWT = {
+    "ALGORITHM": JWT_ALGORITHM,
+    "SIGNING_KEY": JWT_SIGNING_KEY,
+    "VERIFYING_KEY": JWT_VERIFYING_KEY,
+    "AUTH_HEADER_TYPES": ("Bearer",),
+}
+
 # ============================================================================
 # Logging Configuration
 # ============================================================================
@@ -217,17 +334,20 @@ LOGGING = {
     "disable_existing_loggers": False,
     "formatters": {
         "verbose": {
-            "format": "{levelname} {asctime} {module} {message}",
-            "style": "{",
+            "format": "%(levelname)s %(asctime)s %(module)s %(message)s",
         },
         "simple": {
-            "format": "{levelname} {message}",
-            "style": "{",
+            "format": "%(levelname)s %(message)s",
         },
     },
     "handlers": {
+        # Requests only format and enqueue records; a listener thread started
+        # by CoreConfig writes them to stderr (see core/logging.py). Built
+        # with "()" rather than "class" so every Python version constructs a
+        # plain QueueHandler on this queue, without 3.12+'s own listener.
         "console": {
-            "class": "logging.StreamHandler",
+            "()": "logging.handlers.QueueHandler",
+            "queue": "ext://core.logging.LOG_QUEUE",
             "formatter": "verbose",
         },
     },
@@ -238,7 +358,7 @@ LOGGING = {
     "loggers": {
         "django": {
             "handlers": ["console"],
-            "level": os.getenv("DJANGO_LOG_LEVEL", "INFO"),
+            "level": _env("DJANGO_LOG_LEVEL", "INFO"),
             "propagate": False,
         },
         "api": {
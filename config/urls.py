@@ -3,23 +3,24 @@ Main URL configuration for the Financial API.
 Includes API and authentication endpoints.
 """
 
-from typing import Any
+import functools
+from typing import Any, Callable
 
 from django.contrib import admin
+from django.http import HttpRequest, HttpResponseBase
 from django.urls import URLPattern, URLResolver, include, path, re_path
+from django.utils.module_loading import import_string
+from django.views.decorators.csrf import csrf_exempt
 
 from rest_framework import permissions
 
-from drf_yasg import openapi
-from drf_yasg.views import get_schema_view
-from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
+# The generated schema only changes on deploy, so cache it (and the UI pages)
+# instead of re-introspecting every route and serializer on each request.
+SCHEMA_CACHE_TIMEOUT: int = 60 * 60
+SCHEMA_CACHE_KWARGS: dict[str, Any] = {"key_prefix": "swagger"}
 
-# Define API schema view for Swagger documentation
-schema_view: Any = get_schema_view(
-    openapi.Info(
-        title="Django Financial API",
-        default_version="v1.0.0",
-        description="""
+# Markdown description rendered at the top of Swagger UI and ReDoc
+API_DESCRIPTION: str = """
 # Django Financial Transactions API
 
 A **production-ready REST API** for managing financial transactions with
@@ -71,38 +72,154 @@ Transactions support two categories:
 ## Support
 
 For questions or issues, please contact: product.with.saeed@gmail.com
-        """,
-        terms_of_service="https://github.com/product-with-saeed/Django-Financial-API-Template",
-        contact=openapi.Contact(
-            name="Saeed Mohammadpour",
-            email="product.with.saeed@gmail.com",
-            url="https://github.com/product-with-saeed",
-        ),
-        license=openapi.License(
-            name="MIT License",
-            url="https://opensource.org/licenses/MIT",
+        """
+
+
+@functools.cache
+def get_api_schema_view() -> Any:
+    """
+    Build the drf-yasg schema view class on first use.
+
+    Creating the view is deferred until the first documentation request, so
+    processes that never serve the docs (workers handling only API traffic,
+    management commands) skip it at import time.
+
+    Returns:
+        type[APIView]: The schema view class for the Financial API.
+
+    Examples:
+        >>> get_api_schema_view() is get_api_schema_view()
+        True
+    """
+    from drf_yasg import openapi
+    from drf_yasg.views import get_schema_view
+
+    return get_schema_view(
+        openapi.Info(
+            title="Django Financial API",
+            default_version="v1.0.0",
+            description=API_DESCRIPTION,
+            terms_of_service="https://github.com/product-with-saeed/Django-Financial-API-Template",
+            contact=openapi.Contact(
+                name="Saeed Mohammadpour",
+                email="product.with.saeed@gmail.com",
+                url="https://github.com/product-with-saeed",
+            ),
+            license=openapi.License(
+                name="MIT License",
+                url="https://opensource.org/licenses/MIT",
+            ),
         ),
+        public=True,
+        permission_classes=(permissions.AllowAny,),
+    )
+
+
+@functools.cache
+def _build_docs_view(ui: str | None) -> Callable[..., HttpResponseBase]:
+    """Create (once) the cached schema view for ``ui``, or the raw schema."""
+    schema_view = get_api_schema_view()
+    if ui is None:
+        return schema_view.without_ui(
+            cache_timeout=SCHEMA_CACHE_TIMEOUT, cache_kwargs=SCHEMA_CACHE_KWARGS
+        )
+    return schema_view.with_ui(
+        ui, cache_timeout=SCHEMA_CACHE_TIMEOUT, cache_kwargs=SCHEMA_CACHE_KWARGS
+    )
+
+
+def docs_view(ui: str | None = None) -> Callable[..., HttpResponseBase]:
+    """
+    Return a URL view that builds the documentation view on first request.
+
+    Args:
+        ui: ``"swagger"`` or ``"redoc"`` for an interactive UI, or None for
+            the raw JSON/YAML schema.
+
+    Returns:
+        Callable: A CSRF-exempt view function delegating to the schema view.
+
+    Examples:
+        >>> path("redoc/", docs_view("redoc"), name="schema-redoc")
+    """
+
+    @csrf_exempt
+    def view(request: HttpRequest, *args: Any, **kwargs: Any) -> HttpResponseBase:
+        return _build_docs_view(ui)(request, *args, **kwargs)
+
+    return view
+
+
+@functools.cache
+def _build_lazy_view(view_path: str) -> Callable[..., HttpResponseBase]:
+    """Import the class-based view at ``view_path`` (once) and return it."""
+    return import_string(view_path).as_view()
+
+
+class LazyView:
+    """
+    URL view that imports a class-based view on first use.
+
+    Behaves like the function ``as_view()`` returns, including the ``cls``
+    and ``initkwargs`` attributes schema generators introspect; reading
+    those imports the view too.
+
+    Attributes:
+        view_path: Dotted path to an ``APIView`` subclass.
+
+    Examples:
+        >>> path("", LazyView("rest_framework_simplejwt.views.TokenObtainPairView"))
+    """
+
+    csrf_exempt: bool = True
+    initkwargs: dict[str, Any] = {}
+
+    def __init__(self, view_path: str) -> None:
+        self.view_path = view_path
+
+    @property
+    def cls(self) -> type:
+        """Return the view class, importing it if needed."""
+        return import_string(self.view_path)
+
+    def __call__(
+        self, request: HttpRequest, *args: Any, **kwargs: Any
+    ) -> HttpResponseBase:
+        """Dispatch the request to the view."""
+        return _build_lazy_view(self.view_path)(request, *args, **kwargs)
+
+
+# JWT token endpoints, served under api/token/. The SimpleJWT views (and the
+# token serializers they pull in) are imported on the first token request.
+token_urlpatterns: list[URLPattern | URLResolver] = [
+    path(
+        "",
+        LazyView("rest_framework_simplejwt.views.TokenObtainPairView"),
+        name="token_obtain_pair",
     ),
-    public=True,
-    permission_classes=(permissions.AllowAny,),
-)
+    path(
+        "refresh/",
+        LazyView("rest_framework_simplejwt.views.TokenRefreshView"),
+        name="token_refresh",
+    ),
+]
 
-# Define URL patterns
-urlpatterns: list[URLPattern | URLResolver] = [
-    path("admin/", admin.site.urls),
-    path("api/", include("api.urls")),
-    path("api/token/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
-    path("api/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
-    # Swagger & Redoc API documentation endpoints
+# Swagger & Redoc API documentation endpoints, served under docs/
+docs_urlpatterns: list[URLPattern | URLResolver] = [
     re_path(
         r"^swagger(?P<format>\.json|\.yaml)$",
-        schema_view.without_ui(cache_timeout=0),
+        docs_view(),
         name="schema-json",
     ),
-    path(
-        "swagger/",
-        schema_view.with_ui("swagger", cache_timeout=0),
-        name="schema-swagger-ui",
-    ),
-    path("redoc/", schema_view.with_ui("redoc", cache_timeout=0), name="schema-redoc"),
+    path("swagger/", docs_view("swagger"), name="schema-swagger-ui"),
+    path("redoc/", docs_view("redoc"), name="schema-redoc"),
+]
+
+# Define URL patterns. Related routes share an include() so the resolver
+# skips a whole group as soon as its prefix doesn't match.
+urlpatterns: list[URLPattern | URLResolver] = [
+    path("admin/", admin.site.urls),
+    path("api/token/", include(token_urlpatterns)),
+    path("api/", include("api.urls")),
+    path("docs/", include(docs_urlpatterns)),
 ]
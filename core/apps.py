@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    name = "core"
+
+    def ready(self) -> None:
+        """Connect the project's signal receivers and start the log writer."""
+        from core import db  # noqa: F401
+        from core.logging import start_queue_listener
+
+        start_queue_listener()
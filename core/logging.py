@@ -0,0 +1,77 @@
+"""
+Logging setup for Django Financial API.
+
+This module keeps stream writes off the request path: the ``console``
+handler in ``LOGGING`` is a plain ``QueueHandler`` that puts records on
+``LOG_QUEUE``, and a ``QueueListener`` thread, started by ``CoreConfig``,
+writes them to stderr.
+"""
+
+import atexit
+import logging
+import os
+import queue
+import threading
+from logging.handlers import QueueListener
+from typing import TextIO
+
+# Records handed from request threads to the listener thread. ``LOGGING``
+# points the console handler at it with ``ext://core.logging.LOG_QUEUE``.
+LOG_QUEUE: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+
+_listener: QueueListener | None = None
+_listener_lock = threading.Lock()
+
+
+def start_queue_listener(stream: TextIO | None = None) -> QueueListener:
+    """
+    Start the thread that writes queued records, replacing any running one.
+
+    Records reach the queue already formatted by the console handler, so the
+    listener writes each record's message as is.
+
+    Args:
+        stream: Where to write records; defaults to ``sys.stderr``.
+
+    Returns:
+        QueueListener: The started listener.
+
+    Examples:
+        >>> start_queue_listener()
+        <logging.handlers.QueueListener object at ...>
+    """
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+        _listener = QueueListener(LOG_QUEUE, logging.StreamHandler(stream))
+        _listener.start()
+        return _listener
+
+
+def stop_queue_listener() -> None:
+    """
+    Write out every queued record and stop the listener, if running.
+
+    Examples:
+        >>> stop_queue_listener()
+    """
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            _listener = None
+
+
+def _restart_in_child() -> None:
+    """Give a forked worker its own listener; the parent's thread isn't copied."""
+    global _listener, _listener_lock
+    _listener_lock = threading.Lock()
+    if _listener is not None:
+        _listener = None
+        start_queue_listener()
+
+
+# Drain the queue on exit so the last records aren't lost.
+atexit.register(stop_queue_listener)
+os.register_at_fork(after_in_child=_restart_in_child)
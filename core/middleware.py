@@ -0,0 +1,85 @@
+"""
+Middleware for Django Financial API.
+
+The API authenticates with JWT bearer tokens and never uses sessions, CSRF
+cookies or flash messages; only the Django admin does. The classes here are
+drop-in subclasses of Django's session, CSRF, authentication and message
+middleware that run only for admin requests, so API requests skip them
+entirely while the admin keeps working (and Django's admin system checks,
+which look for these middleware by subclass, still pass).
+"""
+
+from typing import Any, Callable, ClassVar
+
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.contrib.messages.middleware import MessageMiddleware
+from django.contrib.sessions.middleware import SessionMiddleware
+from django.http import HttpRequest, HttpResponseBase
+from django.middleware.csrf import CsrfViewMiddleware
+
+
+class AdminOnlyMiddlewareMixin:
+    """
+    Run the wrapped middleware only for requests under ``path_prefix``.
+
+    Requests outside the prefix are passed straight to the next layer
+    without touching the middleware's request, view or response hooks.
+
+    Attributes:
+        path_prefix: URL path prefix the middleware is applied to.
+
+    Examples:
+        >>> class AdminSessionMiddleware(
+        ...     AdminOnlyMiddlewareMixin, SessionMiddleware
+        ... ):
+        ...     pass
+    """
+
+    path_prefix: ClassVar[str] = "/admin/"
+    get_response: Callable[[HttpRequest], Any]
+
+    def applies_to(self, request: HttpRequest) -> bool:
+        """
+        Return whether the middleware should run for this request.
+
+        Args:
+            request: The incoming request.
+
+        Returns:
+            bool: True if the request path is under ``path_prefix``.
+        """
+        return request.path_info.startswith(self.path_prefix)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        """Apply the middleware to admin requests and bypass it otherwise."""
+        if not self.applies_to(request):
+            return self.get_response(request)
+        return super().__call__(request)  # type: ignore[misc]
+
+
+class AdminSessionMiddleware(AdminOnlyMiddlewareMixin, SessionMiddleware):
+    """``SessionMiddleware`` limited to the admin."""
+
+
+class AdminCsrfViewMiddleware(AdminOnlyMiddlewareMixin, CsrfViewMiddleware):
+    """``CsrfViewMiddleware`` limited to the admin."""
+
+    def process_view(
+        self,
+        request: HttpRequest,
+        callback: Callable[..., Any],
+        callback_args: Any,
+        callback_kwargs: Any,
+    ) -> HttpResponseBase | None:
+        """Check the CSRF token for admin views only."""
+        if not self.applies_to(request):
+            return None
+        return super().process_view(request, callback, callback_args, callback_kwargs)
+
+
+class AdminAuthenticationMiddleware(AdminOnlyMiddlewareMixin, AuthenticationMiddleware):
+    """``AuthenticationMiddleware`` limited to the admin."""
+
+
+class AdminMessageMiddleware(AdminOnlyMiddlewareMixin, MessageMiddleware):
+    """``MessageMiddleware`` limited to the admin."""
@@ -0,0 +1,68 @@
+"""
+Serializer base classes for Django Financial API.
+
+This module provides ModelSerializer variants shared across the
+application's API layer.
+"""
+
+import copy
+from typing import Any, ClassVar, TypeVar
+
+from django.db.models import Model
+
+from rest_framework import serializers
+from rest_framework.fields import Field
+
+_ModelT = TypeVar("_ModelT", bound=Model)
+
+
+class CachedModelSerializer(serializers.ModelSerializer[_ModelT]):
+    """
+    ModelSerializer that builds its field map once per class.
+
+    ``ModelSerializer.get_fields()`` re-introspects the model, deep-copies the
+    declared fields and rebuilds every field's kwargs on each instantiation.
+    The resulting field map only depends on the class and its ``Meta``, so it
+    is built on first use, stored on the class, and every later instance gets
+    a one-level copy of each field to bind to itself.
+
+    Subclasses whose fields vary per instance (e.g. fields chosen from the
+    request) or that declare nested serializers must not use this base class,
+    because nested serializers need a deep copy of their child fields.
+
+    Attributes:
+        _field_cache: Unbound fields built for this exact class, or None until
+            the first instance is created. Reset for every subclass.
+
+    Examples:
+        >>> class TransactionSerializer(CachedModelSerializer[Transaction]):
+        ...     class Meta:
+        ...         model = Transaction
+        ...         fields = ("id", "amount")
+        >>> first = TransactionSerializer().fields["amount"]
+        >>> second = TransactionSerializer().fields["amount"]
+        >>> first is second
+        False
+    """
+
+    _field_cache: ClassVar[dict[str, Field] | None] = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Give every subclass its own, initially empty, field cache."""
+        super().__init_subclass__(**kwargs)
+        cls._field_cache = None
+
+    def get_fields(self) -> dict[str, Field]:
+        """
+        Return copies of the class-level cached fields.
+
+        Returns:
+            dict[str, Field]: Unbound field instances keyed by field name,
+                ready to be bound to this serializer.
+        """
+        cls = type(self)
+        cached = cls._field_cache
+        if cached is None:
+            cached = super().get_fields()
+            cls._field_cache = cached
+        return {name: copy.copy(field) for name, field in cached.items()}
@@ -0,0 +1,22 @@
+"""
+URL resolver helpers for Django Financial API.
+
+This module holds the warm-up the server entry points run at worker boot.
+"""
+
+from django.urls import get_resolver
+
+
+def warm_url_resolver() -> None:
+    """
+    Import the URLconf and compile every route pattern ahead of traffic.
+
+    Django builds the resolver lazily, inside the first request each worker
+    resolves. Populating it here moves that cost to worker boot. Only
+    ``config.wsgi`` and ``config.asgi`` call this, so management commands
+    never import the views.
+
+    Examples:
+        >>> warm_url_resolver()
+    """
+    get_resolver()._populate()
@@ -5,17 +5,95 @@ This module provides reusable test fixtures for database setup,
 user authentication, and API client configuration.
 """
 
+import time
+from collections.abc import Callable
+from decimal import Decimal
 from typing import Any
 
 from django.contrib.auth.models import User
+from django.core.cache import caches
 
 from rest_framework.test import APIClient
 
 import pytest
+from rest_framework_simplejwt import settings as jwt_settings
 from rest_framework_simplejwt.tokens import RefreshToken
 
+from api.auth_cache import clear_auth_cache
 from api.models import Transaction
 
+# Encoded access tokens by user pk and signing key, with their expiry. Signing
+# a token is the bulk of authenticated_client's setup cost, and any valid
+# bearer for the user will do, so tokens are reused across tests until shortly
+# before they expire. Reusing one for a recreated user with the same pk is
+# fine: the token only carries the user id.
+_bearer_tokens: dict[tuple[int, str], tuple[str, float]] = {}
+
+
+def bearer_token_for(user: User) -> str:
+    """
+    Return an encoded JWT access token for ``user``, reusing a cached one.
+
+    Args:
+        user: The user to authenticate as.
+
+    Returns:
+        str: An access token that is valid for at least another minute.
+
+    Examples:
+        >>> api_client.credentials(
+        ...     HTTP_AUTHORIZATION=f"Bearer {bearer_token_for(user)}"
+        ... )
+    """
+    key = (user.pk, jwt_settings.api_settings.SIGNING_KEY)
+    cached = _bearer_tokens.get(key)
+    if cached is not None and cached[1] - time.time() > 60:
+        return cached[0]
+    access = RefreshToken.for_user(user).access_token
+    _bearer_tokens[key] = (str(access), float(access["exp"]))
+    return _bearer_tokens[key][0]
+
+
+def jwt_header_for(user: User) -> dict[str, str]:
+    """
+    Return client credentials authenticating as ``user``.
+
+    Args:
+        user: The user to authenticate as.
+
+    Returns:
+        dict[str, str]: Keyword arguments for ``APIClient.credentials``.
+
+    Examples:
+        >>> api_client.credentials(**jwt_header_for(user))
+    """
+    return {"HTTP_AUTHORIZATION": f"Bearer {bearer_token_for(user)}"}
+
+
+@pytest.fixture(autouse=True)
+def _reset_auth_cache() -> Any:
+    """
+    Clear the process-wide JWT verification cache around every test.
+
+    Database rows are rolled back between tests, so a user cached by one test
+    must never be served to the next one.
+    """
+    clear_auth_cache()
+    yield
+    clear_auth_cache()
+
+
+@pytest.fixture(autouse=True)
+def _reset_throttles() -> Any:
+    """
+    Empty the throttle cache before every test.
+
+    Request history would otherwise carry over, and the anonymous rate is low
+    enough for the token endpoint tests to exhaust it.
+    """
+    caches["throttle"].clear()
+    yield
+
 
 @pytest.fixture
 def api_client() -> APIClient:
@@ -33,27 +111,44 @@ def api_client() -> APIClient:
     return APIClient()
 
 
+@pytest.fixture(scope="session")
+def django_db_setup(django_db_setup: Any, django_db_blocker: Any) -> None:
+    """
+    Create the shared test user once per test database.
+
+    Every test rolls back to this state, so the row (and its primary key)
+    is reused by all tests instead of being inserted for each one.
+
+    Args:
+        django_db_setup: Pytest-django's test database setup fixture.
+        django_db_blocker: Pytest-django's database access guard.
+    """
+    # Imported here so runs that never touch the database (schema, settings,
+    # URL tests) don't load factory_boy and Faker
+    from tests.factories import UserFactory
+
+    with django_db_blocker.unblock():
+        UserFactory(username="testuser", email="test@example.com")
+
+
 @pytest.fixture
 def user(db: Any) -> User:
     """
-    Create a test user.
+    Provide the shared test user.
 
     Args:
         db: Pytest-django database fixture.
 
     Returns:
-        User: A created user instance with username 'testuser'.
+        User: The user with username 'testuser', created in ``django_db_setup``.
 
     Examples:
         >>> def test_with_user(user):
         ...     assert user.username == 'testuser'
         ...     assert user.is_active is True
     """
-    return User.objects.create_user(
-        username="testuser",
-        email="test@example.com",
-        password="testpass123",  # nosec B106
-    )
+    # The factory's default password is "testpass123".
+    return User.objects.get(username="testuser")
 
 
 @pytest.fixture
@@ -79,6 +174,22 @@ def admin_user(db: Any) -> User:
     )
 
 
+@pytest.fixture(name="jwt_header_for")
+def jwt_header_for_fixture() -> Callable[[User], dict[str, str]]:
+    """
+    Provide ``jwt_header_for`` to tests that authenticate several users.
+
+    Returns:
+        Callable: Maps a user to ``APIClient.credentials`` keyword arguments,
+            reusing cached tokens.
+
+    Examples:
+        >>> def test_switch_users(api_client, jwt_header_for, user, admin_user):
+        ...     api_client.credentials(**jwt_header_for(admin_user))
+    """
+    return jwt_header_for
+
+
 @pytest.fixture
 def authenticated_client(api_client: APIClient, user: User) -> APIClient:
     """
@@ -96,8 +207,7 @@ def authenticated_client(api_client: APIClient, user: User) -> APIClient:
         ...     response = authenticated_client.get('/api/transactions/')
         ...     assert response.status_code == 200
     """
-    refresh: RefreshToken = RefreshToken.for_user(user)
-    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}")
+    api_client.credentials(**jwt_header_for(user))
     return api_client
 
 
@@ -118,8 +228,7 @@ def admin_client(api_client: APIClient, admin_user: User) -> APIClient:
         ...     response = admin_client.get('/admin/')
         ...     assert response.status_code == 200
     """
-    refresh: RefreshToken = RefreshToken.for_user(admin_user)
-    api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {refresh.access_token}")
+    api_client.credentials(**jwt_header_for(admin_user))
     return api_client
 
 
@@ -147,6 +256,34 @@ def sample_transaction(user: User) -> Transaction:
     )
 
 
+@pytest.fixture
+def unsaved_transaction(user: User) -> Transaction:
+    """
+    Build the sample transaction without saving it.
+
+    For tests that only read the instance (serializer output, ``__str__``),
+    skipping the INSERT keeps them cheaper than ``sample_transaction``.
+
+    Args:
+        user: User fixture.
+
+    Returns:
+        Transaction: An unsaved transaction instance with no primary key.
+
+    Examples:
+        >>> def test_str(unsaved_transaction):
+        ...     assert str(unsaved_transaction) == 'testuser - income: $100.50'
+    """
+    from tests.factories import TransactionFactory
+
+    return TransactionFactory.build(
+        user=user,
+        amount=Decimal("100.50"),
+        category="income",
+        description="Test transaction",
+    )
+
+
 @pytest.fixture
 def multiple_transactions(user: User) -> list[Transaction]:
     """
@@ -162,13 +299,15 @@ def multiple_transactions(user: User) -> list[Transaction]:
         >>> def test_list(multiple_transactions):
         ...     assert len(multiple_transactions) == 5
     """
-    transactions = [
-        Transaction.objects.create(
-            user=user,
-            amount=100.00 + i * 10,
-            category="income" if i % 2 == 0 else "expense",
-            description=f"Transaction {i}",
-        )
-        for i in range(5)
-    ]
-    return transactions
+    # One multi-row INSERT instead of a round-trip per transaction.
+    return Transaction.objects.bulk_create(
+        [
+            Transaction(
+                user=user,
+                amount=100.00 + i * 10,
+                category="income" if i % 2 == 0 else "expense",
+                description=f"Transaction {i}",
+            )
+            for i in range(5)
+        ]
+    )
@@ -3,6 +3,9 @@ Factory for Transaction model test data generation.
 """
 
 from decimal import Decimal
+from typing import Any
+
+from django.contrib.auth.models import User
 
 import factory
 from factory.django import DjangoModelFactory
@@ -58,3 +61,27 @@ class TransactionFactory(DjangoModelFactory):
     )
     category = factory.Iterator(["income", "expense"])
     description = factory.Faker("sentence", nb_words=6)
+
+
+def make_transactions(user: User, n: int, **kwargs: Any) -> list[Transaction]:
+    """
+    Create ``n`` transactions for ``user`` with a single INSERT.
+
+    Field values come from ``TransactionFactory``; use this instead of
+    ``create_batch`` when the rows only need to exist.
+
+    Args:
+        user: Owner of the transactions.
+        n: Number of transactions to create.
+        **kwargs: Field values overriding the factory defaults.
+
+    Returns:
+        list[Transaction]: The created transactions.
+
+    Examples:
+        >>> len(make_transactions(user, 3, category="income"))
+        3
+    """
+    return Transaction.objects.bulk_create(
+        TransactionFactory.build_batch(n, user=user, **kwargs)
+    )
@@ -2,11 +2,30 @@
 Factory for User model test data generation.
 """
 
+import functools
+
+from django.contrib.auth.hashers import make_password
 from django.contrib.auth.models import User
 
 import factory
 from factory.django import DjangoModelFactory
 
+DEFAULT_PASSWORD = "testpass123"  # nosec B105
+
+
+@functools.cache
+def default_password_hash() -> str:
+    """
+    Return the hash of ``DEFAULT_PASSWORD``, computed once per test run.
+
+    Every factory user shares the default password, so there is no need to
+    pay for hashing it per user.
+
+    Returns:
+        str: The encoded password hash.
+    """
+    return make_password(DEFAULT_PASSWORD)
+
 
 class UserFactory(DjangoModelFactory):
     """
@@ -70,4 +89,4 @@ class UserFactory(DjangoModelFactory):
         if extracted:
             self.set_password(extracted)
         else:
-            self.set_password("testpass123")  # nosec B106
+            self.password = default_password_hash()
@@ -5,6 +5,7 @@ Tests complete workflows from creation to deletion, JWT authentication flow,
 and multi-user scenarios.
 """
 
+from collections.abc import Callable
 from decimal import Decimal
 from typing import Any
 
@@ -14,27 +15,39 @@ from rest_framework import status
 from rest_framework.test import APIClient
 
 import pytest
-from rest_framework_simplejwt.tokens import RefreshToken
 
 from api.models import Transaction
 from tests.factories import TransactionFactory, UserFactory
 
+JWTHeaderFor = Callable[[User], dict[str, str]]
+
+# Request bodies shared by the tests below; the client never mutates them.
+CREATE_DATA: dict[str, str] = {
+    "amount": "100.00",
+    "category": "income",
+    "description": "Initial transaction",
+}
+UPDATE_DATA: dict[str, str] = {
+    "amount": "150.00",
+    "category": "expense",
+    "description": "Updated transaction",
+}
+PATCH_DATA: dict[str, str] = {"amount": "300.00"}
+
 
 @pytest.mark.django_db
 class TestTransactionLifecycle:
     """Test suite for complete transaction lifecycle scenarios."""
 
     def test_full_transaction_crud_lifecycle(
-        self, authenticated_client: APIClient, user: User
+        self,
+        authenticated_client: APIClient,
+        user: User,
+        django_assert_num_queries: Any,
     ) -> None:
         """Test complete CRUD lifecycle: create, read, update, delete."""
         # 1. Create transaction
-        create_data: dict[str, Any] = {
-            "amount": "100.00",
-            "category": "income",
-            "description": "Initial transaction",
-        }
-        create_response = authenticated_client.post("/api/transactions/", create_data)
+        create_response = authenticated_client.post("/api/transactions/", CREATE_DATA)
         assert create_response.status_code == status.HTTP_201_CREATED
         transaction_id = create_response.data["id"]  # type: ignore[index]
 
@@ -43,27 +56,24 @@ class TestTransactionLifecycle:
             f"/api/transactions/{transaction_id}/"
         )
         assert retrieve_response.status_code == status.HTTP_200_OK
-        assert Decimal(retrieve_response.data["amount"]) == Decimal("100.00")  # type: ignore[index]
+        assert retrieve_response.data["amount"] == "100.00"  # type: ignore[index]
         assert retrieve_response.data["description"] == "Initial transaction"  # type: ignore[index]
 
         # 3. Update transaction
-        update_data: dict[str, Any] = {
-            "amount": "150.00",
-            "category": "expense",
-            "description": "Updated transaction",
-        }
         update_response = authenticated_client.put(
-            f"/api/transactions/{transaction_id}/", update_data
+            f"/api/transactions/{transaction_id}/", UPDATE_DATA
         )
         assert update_response.status_code == status.HTTP_200_OK
-        assert Decimal(update_response.data["amount"]) == Decimal("150.00")  # type: ignore[index]
+        assert update_response.data["amount"] == "150.00"  # type: ignore[index]
         assert update_response.data["category"] == "expense"  # type: ignore[index]
 
-        # 4. Verify update in list
-        list_response = authenticated_client.get("/api/transactions/")
+        # 4. Verify update in list: one query for the ETag validators and one
+        # for the page; rows are serialized from values(), never joining user.
+        with django_assert_num_queries(2):
+            list_response = authenticated_client.get("/api/transactions/")
         assert list_response.status_code == status.HTTP_200_OK
-        assert len(list_response.data) == 1  # type: ignore[arg-type]
-        assert Decimal(list_response.data[0]["amount"]) == Decimal("150.00")  # type: ignore[index]
+        assert len(list_response.data["results"]) == 1  # type: ignore[arg-type]
+        assert list_response.data["results"][0]["amount"] == "150.00"  # type: ignore[index]
 
         # 5. Delete transaction
         delete_response = authenticated_client.delete(
@@ -73,7 +83,7 @@ class TestTransactionLifecycle:
 
         # 6. Verify deletion
         list_after_delete = authenticated_client.get("/api/transactions/")
-        assert len(list_after_delete.data) == 0  # type: ignore[arg-type]
+        assert len(list_after_delete.data["results"]) == 0  # type: ignore[arg-type]
 
     def test_jwt_authentication_flow(self, api_client: APIClient) -> None:
         """Test complete JWT authentication and token usage flow."""
@@ -96,20 +106,21 @@ class TestTransactionLifecycle:
 
         # 3. Use access token to create transaction
         api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {access_token}")
-        create_data: dict[str, Any] = {
-            "amount": "200.00",
-            "category": "income",
-        }
-        create_response = api_client.post("/api/transactions/", create_data)
+        create_response = api_client.post("/api/transactions/", CREATE_DATA)
         assert create_response.status_code == status.HTTP_201_CREATED
         assert create_response.data["user"] == user.id  # type: ignore[index]
 
         # 4. Use token to list transactions
         list_response = api_client.get("/api/transactions/")
         assert list_response.status_code == status.HTTP_200_OK
-        assert len(list_response.data) == 1  # type: ignore[arg-type]
+        assert len(list_response.data["results"]) == 1  # type: ignore[arg-type]
 
-    def test_multi_user_isolation_scenario(self, api_client: APIClient) -> None:
+    def test_multi_user_isolation_scenario(
+        self,
+        api_client: APIClient,
+        jwt_header_for: JWTHeaderFor,
+        django_assert_num_queries: Any,
+    ) -> None:
         """Test that multiple users can only access their own transactions."""
         # Create two users
         user1 = UserFactory(username="user1")
@@ -130,40 +141,41 @@ class TestTransactionLifecycle:
         )
 
         # User1 authenticates and lists transactions
-        user1_token = str(RefreshToken.for_user(user1).access_token)
-        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {user1_token}")
-        user1_response = api_client.get("/api/transactions/")
+        api_client.credentials(**jwt_header_for(user1))
+        # User lookup, ETag validators and page: no query per row
+        with django_assert_num_queries(3):
+            user1_response = api_client.get("/api/transactions/")
 
         assert user1_response.status_code == status.HTTP_200_OK
-        assert len(user1_response.data) == 2  # type: ignore[arg-type]
-        user1_ids = [t["id"] for t in user1_response.data]  # type: ignore[union-attr]
+        assert len(user1_response.data["results"]) == 2  # type: ignore[arg-type]
+        user1_ids = [t["id"] for t in user1_response.data["results"]]  # type: ignore[union-attr]
         assert user1_transaction1.id in user1_ids
         assert user1_transaction2.id in user1_ids
         assert user2_transaction1.id not in user1_ids
         assert user2_transaction2.id not in user1_ids
 
         # User2 authenticates and lists transactions
-        user2_token = str(RefreshToken.for_user(user2).access_token)
-        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {user2_token}")
-        user2_response = api_client.get("/api/transactions/")
+        api_client.credentials(**jwt_header_for(user2))
+        with django_assert_num_queries(3):
+            user2_response = api_client.get("/api/transactions/")
 
         assert user2_response.status_code == status.HTTP_200_OK
-        assert len(user2_response.data) == 2  # type: ignore[arg-type]
-        user2_ids = [t["id"] for t in user2_response.data]  # type: ignore[union-attr]
+        assert len(user2_response.data["results"]) == 2  # type: ignore[arg-type]
+        user2_ids = [t["id"] for t in user2_response.data["results"]]  # type: ignore[union-attr]
         assert user2_transaction1.id in user2_ids
         assert user2_transaction2.id in user2_ids
         assert user1_transaction1.id not in user2_ids
         assert user1_transaction2.id not in user2_ids
 
         # User1 cannot access User2's transaction
-        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {user1_token}")
+        api_client.credentials(**jwt_header_for(user1))
         forbidden_response = api_client.get(
             f"/api/transactions/{user2_transaction1.id}/"
         )
         assert forbidden_response.status_code == status.HTTP_404_NOT_FOUND
 
     def test_transaction_updates_maintain_user_ownership(
-        self, api_client: APIClient
+        self, api_client: APIClient, jwt_header_for: JWTHeaderFor
     ) -> None:
         """Test that updating transaction does not change ownership."""
         user1 = UserFactory(username="owner")
@@ -173,24 +185,21 @@ class TestTransactionLifecycle:
         transaction = TransactionFactory(user=user1, amount=Decimal("100.00"))
 
         # User2 authenticates and attempts to update User1's transaction
-        user2_token = str(RefreshToken.for_user(user2).access_token)
-        api_client.credentials(HTTP_AUTHORIZATION=f"Bearer {user2_token}")
+        api_client.credentials(**jwt_header_for(user2))
 
-        update_data: dict[str, Any] = {
-            "amount": "999.00",
-            "category": "expense",
-        }
         update_response = api_client.put(
-            f"/api/transactions/{transaction.id}/", update_data
+            f"/api/transactions/{transaction.id}/", UPDATE_DATA
         )
 
         # Should fail with 404 (transaction not in user2's queryset)
         assert update_response.status_code == status.HTTP_404_NOT_FOUND
 
-        # Verify transaction is unchanged
-        transaction.refresh_from_db()
-        assert transaction.amount == Decimal("100.00")
-        assert transaction.user == user1
+        # Verify transaction is unchanged; only the asserted columns are read
+        fresh = Transaction.objects.only("amount_cents", "user_id").get(
+            pk=transaction.pk
+        )
+        assert fresh.amount == Decimal("100.00")
+        assert fresh.user_id == user1.id
 
     def test_cascade_delete_user_deletes_transactions(self) -> None:
         """Test that deleting a user cascades to delete their transactions."""
@@ -210,33 +219,42 @@ class TestTransactionLifecycle:
         # Verify all user's transactions are deleted
         assert Transaction.objects.filter(id__in=transaction_ids).count() == 0
 
-    def test_bulk_transaction_creation_for_user(
+    def test_created_transaction_appears_in_list(
         self, authenticated_client: APIClient, user: User
     ) -> None:
-        """Test creating multiple transactions for a user in sequence."""
-        transactions_data = [
-            {"amount": "100.00", "category": "income", "description": "Salary"},
-            {"amount": "50.00", "category": "expense", "description": "Groceries"},
-            {"amount": "200.00", "category": "income", "description": "Freelance"},
-            {"amount": "30.00", "category": "expense", "description": "Transport"},
-            {"amount": "150.00", "category": "income", "description": "Bonus"},
-        ]
-
-        created_ids = []
-        for data in transactions_data:
-            response = authenticated_client.post("/api/transactions/", data)
-            assert response.status_code == status.HTTP_201_CREATED
-            created_ids.append(response.data["id"])  # type: ignore[index]
-
-        # Verify all transactions are in the list
+        """Test a transaction created through the API is listed for its user."""
+        data = {"amount": "100.00", "category": "income", "description": "Salary"}
+
+        response = authenticated_client.post("/api/transactions/", data)
+        assert response.status_code == status.HTTP_201_CREATED
+
+        list_response = authenticated_client.get("/api/transactions/")
+        returned_ids = [t["id"] for t in list_response.data["results"]]  # type: ignore[union-attr]
+        assert returned_ids == [response.data["id"]]  # type: ignore[index]
+
+    def test_list_returns_all_transactions_for_user(
+        self, authenticated_client: APIClient, user: User
+    ) -> None:
+        """Test every transaction a user owns is returned by the list."""
+        # The create path is covered above; insert the rest in one query.
+        created = Transaction.objects.bulk_create(
+            Transaction(user=user, amount=Decimal(amount), category=category)
+            for amount, category in [
+                ("100.00", "income"),
+                ("50.00", "expense"),
+                ("200.00", "income"),
+                ("30.00", "expense"),
+                ("150.00", "income"),
+            ]
+        )
+
         list_response = authenticated_client.get("/api/transactions/")
         assert list_response.status_code == status.HTTP_200_OK
-        assert len(list_response.data) == 5  # type: ignore[arg-type]
+        assert len(list_response.data["results"]) == 5  # type: ignore[arg-type]
 
         # Verify all created IDs are present
-        returned_ids = [t["id"] for t in list_response.data]  # type: ignore[union-attr]
-        for created_id in created_ids:
-            assert created_id in returned_ids
+        returned_ids = [t["id"] for t in list_response.data["results"]]  # type: ignore[union-attr]
+        assert set(returned_ids) == {transaction.id for transaction in created}
 
     def test_unauthenticated_access_rejected_for_all_endpoints(
         self, api_client: APIClient, user: User
@@ -253,21 +271,18 @@ class TestTransactionLifecycle:
         assert retrieve_response.status_code == status.HTTP_401_UNAUTHORIZED
 
         # Test CREATE
-        create_data: dict[str, Any] = {"amount": "100.00", "category": "income"}
-        create_response = api_client.post("/api/transactions/", create_data)
+        create_response = api_client.post("/api/transactions/", CREATE_DATA)
         assert create_response.status_code == status.HTTP_401_UNAUTHORIZED
 
         # Test UPDATE
-        update_data: dict[str, Any] = {"amount": "200.00", "category": "expense"}
         update_response = api_client.put(
-            f"/api/transactions/{transaction.id}/", update_data
+            f"/api/transactions/{transaction.id}/", UPDATE_DATA
         )
         assert update_response.status_code == status.HTTP_401_UNAUTHORIZED
 
         # Test PARTIAL UPDATE
-        patch_data: dict[str, Any] = {"amount": "300.00"}
         patch_response = api_client.patch(
-            f"/api/transactions/{transaction.id}/", patch_data
+            f"/api/transactions/{transaction.id}/", PATCH_DATA
         )
         assert patch_response.status_code == status.HTTP_401_UNAUTHORIZED
 
@@ -0,0 +1,37 @@
+"""
+Django settings for the test suite.
+
+Extends the project settings with overrides that only make sense in tests.
+"""
+
+from config.settings import *  # noqa: F401,F403
+from config.settings import DATABASES, STORAGES
+
+# Tests don't run collectstatic, so there is no manifest of hashed file names
+# for templates rendering {% static %} (admin, Swagger UI) to look up.
+STORAGES = {
+    **STORAGES,
+    "staticfiles": {
+        "BACKEND": "django.contrib.staticfiles.storage.StaticFilesStorage",
+    },
+}
+
+# Fixtures create users with passwords in most tests; PBKDF2's hundreds of
+# thousands of iterations would dominate their cost. Never use this outside
+# tests.
+PASSWORD_HASHERS = ["django.contrib.auth.hashers.MD5PasswordHasher"]
+
+# Build the test database in memory, straight from the models (pytest runs
+# with --nomigrations), instead of replaying every migration on disk.
+DATABASES = {
+    **DATABASES,
+    "default": {**DATABASES["default"], "TEST": {"NAME": ":memory:"}},
+}
+
+# The documentation tests check paths, methods and parameters, not how
+# filters or pagination are described, so skip those drf-yasg inspection
+# passes when the schema is generated.
+SWAGGER_SETTINGS = {
+    "DEFAULT_FILTER_INSPECTORS": [],
+    "DEFAULT_PAGINATOR_INSPECTORS": [],
+}
@@ -0,0 +1,68 @@
+"""
+Unit tests for the app configurations and server entry points.
+
+Tests signal receivers are connected by the core app, and that only the
+WSGI/ASGI entry points populate the URL resolver.
+"""
+
+import importlib
+import subprocess
+import sys
+
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.urls import clear_url_caches, get_resolver
+
+import pytest
+
+from core.db import configure_sqlite
+from core.urls import warm_url_resolver
+
+
+class TestCoreConfig:
+    """Test suite for CoreConfig.ready."""
+
+    def test_ready_connects_sqlite_receiver(self) -> None:
+        """Test the SQLite pragma receiver listens for new connections."""
+        receivers = connection_created._live_receivers(sender=None)
+
+        assert configure_sqlite in receivers
+
+
+class TestServerEntryPoints:
+    """Test suite for the URL resolver warm-up in config.wsgi/config.asgi."""
+
+    @pytest.mark.parametrize("module", ["config.wsgi", "config.asgi"])
+    def test_entry_point_populates_url_resolver(self, module: str) -> None:
+        """Test routes are compiled before the first request is resolved."""
+        clear_url_caches()
+
+        importlib.reload(importlib.import_module(module))
+
+        assert get_resolver()._populated
+
+    def test_warm_url_resolver_compiles_routes(self) -> None:
+        """Test the helper fills the resolver's reverse lookup table."""
+        clear_url_caches()
+
+        warm_url_resolver()
+
+        assert get_resolver()._populated
+        assert get_resolver()._reverse_dict
+
+    def test_management_commands_do_not_import_urlconf(self) -> None:
+        """Test setting Django up leaves the URLconf and views unimported."""
+        code = (
+            "import sys, django; django.setup(); "
+            "print('config.urls' in sys.modules, 'api.views' in sys.modules)"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=settings.BASE_DIR,
+        )
+
+        assert result.stdout.split() == ["False", "False"]
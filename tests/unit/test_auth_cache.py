@@ -0,0 +1,273 @@
+"""
+Unit tests for cached JWT authentication.
+
+Tests cache hits, expiry, and fallthrough for requests without tokens.
+"""
+
+from datetime import timedelta
+from typing import Any
+from unittest import mock
+
+from django.conf import settings as django_settings
+from django.contrib.auth.models import User
+
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.test import APIRequestFactory
+
+import jwt
+import pytest
+from rest_framework_simplejwt.exceptions import InvalidToken
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from api import auth_cache
+from api.auth_cache import CachedJWTAuthentication, get_verification_params
+
+
+def _request_with_token(token: str) -> Any:
+    """Build a request carrying the given bearer token."""
+    return APIRequestFactory().get(
+        "/api/transactions/", HTTP_AUTHORIZATION=f"Bearer {token}"
+    )
+
+
+@pytest.mark.django_db
+class TestCachedJWTAuthentication:
+    """Test suite for CachedJWTAuthentication."""
+
+    def test_returns_none_without_header(self) -> None:
+        """Test requests without an Authorization header are not authenticated."""
+        request = APIRequestFactory().get("/api/transactions/")
+
+        assert CachedJWTAuthentication().authenticate(request) is None
+
+    def test_returns_none_for_other_auth_schemes(self) -> None:
+        """Test non-Bearer Authorization headers are ignored."""
+        request = APIRequestFactory().get(
+            "/api/transactions/", HTTP_AUTHORIZATION="Basic dXNlcjpwYXNz"
+        )
+
+        assert CachedJWTAuthentication().authenticate(request) is None
+
+    def test_repeat_token_is_served_from_cache(
+        self, user: User, django_assert_num_queries: Any
+    ) -> None:
+        """Test a second request with the same token skips the user lookup."""
+        token = str(AccessToken.for_user(user))
+        authentication = CachedJWTAuthentication()
+
+        with django_assert_num_queries(1):
+            first = authentication.authenticate(_request_with_token(token))
+        with django_assert_num_queries(0):
+            second = authentication.authenticate(_request_with_token(token))
+
+        assert first is not None and second is not None
+        assert second[0] == user
+        assert second[1] is first[1]
+
+    def test_expired_cache_entry_is_reverified(
+        self, user: User, django_assert_num_queries: Any
+    ) -> None:
+        """Test entries past the token's expiry are not served."""
+        token = str(AccessToken.for_user(user))
+        authentication = CachedJWTAuthentication()
+        authentication.authenticate(_request_with_token(token))
+
+        for key, cached in list(auth_cache._token_cache.items()):
+            del auth_cache._token_cache[key]
+            auth_cache._token_cache[key] = cached._replace(expires_at=0)
+        assert len(auth_cache._token_cache) == 0
+        auth_cache._user_cache.clear()
+
+        with django_assert_num_queries(1):
+            result = authentication.authenticate(_request_with_token(token))
+
+        assert result is not None
+        assert result[0] == user
+
+    def test_cache_entries_expire_at_token_exp_or_ttl(self) -> None:
+        """Test entries live for AUTH_CACHE_TTL but never past the token's exp."""
+        now = 1_000.0
+        long_lived = auth_cache.CachedAuth(None, now + 3600)  # type: ignore[arg-type]
+        short_lived = auth_cache.CachedAuth(None, now + 5)  # type: ignore[arg-type]
+
+        assert auth_cache._token_expiry(b"", long_lived, now) == (
+            now + auth_cache.AUTH_CACHE_TTL
+        )
+        assert auth_cache._token_expiry(b"", short_lived, now) == now + 5
+
+    def test_user_is_reused_across_tokens(
+        self, user: User, django_assert_num_queries: Any
+    ) -> None:
+        """Test a new token for a recently seen user skips the user lookup."""
+        authentication = CachedJWTAuthentication()
+        first_token = str(AccessToken.for_user(user))
+        second_token = str(AccessToken.for_user(user))
+
+        with django_assert_num_queries(1):
+            authentication.authenticate(_request_with_token(first_token))
+        with django_assert_num_queries(0):
+            result = authentication.authenticate(_request_with_token(second_token))
+
+        assert result is not None
+        assert result[0] == user
+
+    def test_requests_get_their_own_user_instance(self, user: User) -> None:
+        """Test a cache hit hands out a copy, never the cached instance."""
+        token = str(AccessToken.for_user(user))
+        authentication = CachedJWTAuthentication()
+
+        first = authentication.authenticate(_request_with_token(token))
+        second = authentication.authenticate(_request_with_token(token))
+
+        assert first is not None and second is not None
+        assert first[0] == second[0] == user
+        assert first[0] is not second[0]
+        assert first[0] is not auth_cache._user_cache[str(user.pk)]
+
+    def test_deactivated_user_is_rejected(self, user: User) -> None:
+        """Test saving a user evicts it, so deactivation takes effect at once."""
+        authentication = CachedJWTAuthentication()
+        authentication.authenticate(
+            _request_with_token(str(AccessToken.for_user(user)))
+        )
+
+        user.is_active = False
+        user.save(update_fields=["is_active"])
+
+        with pytest.raises(AuthenticationFailed):
+            authentication.authenticate(
+                _request_with_token(str(AccessToken.for_user(user)))
+            )
+
+    def test_cached_inactive_user_is_rejected(self, user: User) -> None:
+        """Test cache hits are checked against USER_AUTHENTICATION_RULE."""
+        authentication = CachedJWTAuthentication()
+        authentication.authenticate(
+            _request_with_token(str(AccessToken.for_user(user)))
+        )
+
+        auth_cache._user_cache[str(user.pk)].is_active = False
+
+        with pytest.raises(AuthenticationFailed):
+            authentication.authenticate(
+                _request_with_token(str(AccessToken.for_user(user)))
+            )
+
+    def test_token_without_user_id_is_rejected(self, user: User) -> None:
+        """Test get_user defers to SimpleJWT when the user id claim is absent."""
+        token = AccessToken.for_user(user)
+        del token["user_id"]
+
+        with pytest.raises(InvalidToken):
+            CachedJWTAuthentication().get_user(token)
+
+        assert len(auth_cache._user_cache) == 0
+
+    def test_invalid_token_is_not_cached(self) -> None:
+        """Test verification failures raise and leave the cache empty."""
+        with pytest.raises(InvalidToken):
+            CachedJWTAuthentication().authenticate(_request_with_token("garbage"))
+
+        assert len(auth_cache._token_cache) == 0
+
+    def test_validated_token_wraps_decoded_payload(self, user: User) -> None:
+        """Test a single decode yields a usable access token."""
+        access = AccessToken.for_user(user)
+
+        with mock.patch.object(AccessToken, "__init__") as token_init:
+            validated = CachedJWTAuthentication().get_validated_token(
+                str(access).encode()
+            )
+
+        token_init.assert_not_called()
+        assert isinstance(validated, AccessToken)
+        assert validated.payload == access.payload
+        assert validated.token == str(access).encode()
+        # Methods that read the wrapper's own state still work
+        validated.check_exp()
+
+    def test_expired_token_is_rejected(self, user: User) -> None:
+        """Test tokens past their exp claim fail validation."""
+        access = AccessToken.for_user(user)
+        access.set_exp(lifetime=-timedelta(seconds=1))
+
+        with pytest.raises(InvalidToken) as exc_info:
+            CachedJWTAuthentication().get_validated_token(str(access).encode())
+
+        assert "expired" in str(exc_info.value.detail["messages"][0]["message"])
+
+    def test_refresh_token_is_rejected(self, user: User) -> None:
+        """Test refresh tokens cannot be used as bearer tokens."""
+        refresh = RefreshToken.for_user(user)
+
+        with pytest.raises(InvalidToken):
+            CachedJWTAuthentication().get_validated_token(str(refresh).encode())
+
+    def test_token_missing_required_claim_is_rejected(self, user: User) -> None:
+        """Test tokens without a user id claim fail validation."""
+        access = AccessToken.for_user(user)
+        del access["user_id"]
+
+        with pytest.raises(InvalidToken):
+            CachedJWTAuthentication().get_validated_token(str(access).encode())
+
+    def test_multiple_token_classes_use_simplejwt_validation(
+        self, user: User, settings: Any
+    ) -> None:
+        """Test configurations with several token classes fall back to SimpleJWT."""
+        settings.SIMPLE_JWT = {
+            "AUTH_TOKEN_CLASSES": (
+                "rest_framework_simplejwt.tokens.AccessToken",
+                "rest_framework_simplejwt.tokens.SlidingToken",
+            )
+        }
+        access = AccessToken.for_user(user)
+
+        validated = CachedJWTAuthentication().get_validated_token(str(access).encode())
+
+        assert validated["user_id"] == access["user_id"]
+
+
+class TestVerificationParams:
+    """Test suite for cached JWT verification parameters."""
+
+    def test_project_settings_pin_hs256_with_secret_key(self) -> None:
+        """Test the project's SIMPLE_JWT block verifies with SECRET_KEY."""
+        assert get_verification_params() == (
+            "HS256",
+            django_settings.SECRET_KEY.encode(),
+        )
+
+    def test_hmac_algorithms_verify_with_signing_key(self, settings: Any) -> None:
+        """Test HMAC algorithms verify with the signing secret."""
+        settings.SIMPLE_JWT = {"ALGORITHM": "HS512", "SIGNING_KEY": "s" * 64}
+
+        assert get_verification_params() == ("HS512", b"s" * 64)
+
+    def test_asymmetric_algorithms_verify_with_verifying_key(
+        self, settings: Any
+    ) -> None:
+        """Test asymmetric algorithms verify with the public key."""
+        settings.SIMPLE_JWT = {
+            "ALGORITHM": "RS256",
+            "SIGNING_KEY": "private",
+            "VERIFYING_KEY": "public",
+        }
+
+        assert get_verification_params() == ("RS256", "public")
+
+    def test_verification_key_is_prepared_once(self, settings: Any) -> None:
+        """Test the key is prepared on first use and reused afterwards."""
+        settings.SIMPLE_JWT = {"ALGORITHM": "HS256", "SIGNING_KEY": "k" * 64}
+
+        with mock.patch.object(
+            jwt.algorithms.HMACAlgorithm,
+            "prepare_key",
+            autospec=True,
+            return_value=b"prepared",
+        ) as prepare_key:
+            first = get_verification_params()
+            second = get_verification_params()
+
+        assert first == second == ("HS256", b"prepared")
+        prepare_key.assert_called_once()
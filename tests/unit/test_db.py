@@ -0,0 +1,48 @@
+"""
+Unit tests for database connection tuning.
+
+Tests that SQLite connections are opened with the configured pragmas.
+"""
+
+from typing import Any
+from unittest import mock
+
+from django.db import connection
+
+import pytest
+
+from core.db import SQLITE_PRAGMAS, configure_sqlite
+
+
+@pytest.mark.django_db
+class TestConfigureSqlite:
+    """Test suite for the SQLite connection pragmas."""
+
+    def test_sqlite_connection_uses_tuned_pragmas(self) -> None:
+        """Test SQLite connections get the tuned synchronous and cache settings."""
+        with connection.cursor() as cursor:
+            synchronous = cursor.execute("PRAGMA synchronous").fetchone()[0]
+            cache_size = cursor.execute("PRAGMA cache_size").fetchone()[0]
+
+        assert synchronous == 1  # NORMAL
+        assert cache_size == -20000
+
+    def test_other_backends_are_untouched(self) -> None:
+        """Test non-SQLite connections are not sent SQLite pragmas."""
+        other: Any = mock.Mock(vendor="postgresql")
+
+        configure_sqlite(sender=type(other), connection=other)
+
+        other.cursor.assert_not_called()
+
+    def test_all_pragmas_are_applied(self) -> None:
+        """Test every configured pragma is executed on connect."""
+        cursor = mock.MagicMock()
+        sqlite: Any = mock.MagicMock(vendor="sqlite")
+        sqlite.cursor.return_value.__enter__.return_value = cursor
+
+        configure_sqlite(sender=type(sqlite), connection=sqlite)
+
+        assert [c.args[0] for c in cursor.execute.call_args_list] == list(
+            SQLITE_PRAGMAS
+        )
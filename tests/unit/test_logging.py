@@ -0,0 +1,87 @@
+"""
+Unit tests for the logging setup.
+
+Tests that records logged through the project's LOGGING config are written
+by the queue listener thread.
+"""
+
+import io
+import logging
+import logging.config
+import threading
+from collections.abc import Iterator
+from logging.handlers import QueueHandler
+
+from django.conf import settings
+
+import pytest
+
+from core import logging as core_logging
+
+
+@pytest.fixture
+def log_stream() -> Iterator[io.StringIO]:
+    """Apply the project's LOGGING and point the listener at a StringIO."""
+    logging.config.dictConfig(settings.LOGGING)
+    stream = io.StringIO()
+    core_logging.start_queue_listener(stream)
+    yield stream
+    core_logging.start_queue_listener()
+
+
+class TestQueueLogging:
+    """Test suite for the queued console handler and its listener."""
+
+    def test_settings_logging_writes_through_listener(
+        self, log_stream: io.StringIO
+    ) -> None:
+        """Test dictConfig(settings.LOGGING) yields a working queued handler."""
+        logging.getLogger("api").warning("balance %s", 42)
+        core_logging.stop_queue_listener()
+
+        assert log_stream.getvalue().startswith("WARNING ")
+        assert log_stream.getvalue().endswith(" balance 42\n")
+
+    def test_console_handler_is_plain_queue_handler(
+        self, log_stream: io.StringIO
+    ) -> None:
+        """Test the console handler enqueues onto the listener's queue."""
+        handlers = [
+            handler
+            for handler in logging.getLogger("api").handlers
+            if isinstance(handler, QueueHandler)
+        ]
+
+        assert [type(handler) for handler in handlers] == [QueueHandler]
+        assert handlers[0].queue is core_logging.LOG_QUEUE
+
+    def test_writing_happens_off_the_calling_thread(
+        self, log_stream: io.StringIO
+    ) -> None:
+        """Test the stream is written by the listener thread."""
+        listener = core_logging.start_queue_listener(log_stream)
+        (stream_handler,) = listener.handlers
+        threads: list[str] = []
+        original_emit = stream_handler.emit
+
+        def record_thread(record: logging.LogRecord) -> None:
+            threads.append(threading.current_thread().name)
+            original_emit(record)
+
+        stream_handler.emit = record_thread  # type: ignore[method-assign]
+        logging.getLogger("api").warning("hello")
+        core_logging.stop_queue_listener()
+
+        assert threads and threads[0] != threading.current_thread().name
+
+    def test_restarting_the_listener_keeps_one_running(
+        self, log_stream: io.StringIO
+    ) -> None:
+        """Test a restart stops the previous listener before starting anew."""
+        first = core_logging.start_queue_listener(log_stream)
+        second = core_logging.start_queue_listener(log_stream)
+        logging.getLogger("api").warning("once")
+        core_logging.stop_queue_listener()
+
+        assert first._thread is None and second._thread is None
+        assert log_stream.getvalue().count("once") == 1
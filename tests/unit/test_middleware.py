@@ -0,0 +1,54 @@
+"""
+Unit tests for admin-only middleware.
+
+Tests that session, CSRF, auth and message middleware run only for the admin.
+"""
+
+from django.contrib.auth.models import User
+from django.test import Client
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+import pytest
+
+
+@pytest.mark.django_db
+class TestAdminOnlyMiddleware:
+    """Test suite for the admin-gated middleware."""
+
+    def test_api_requests_skip_session_middleware(
+        self, authenticated_client: APIClient
+    ) -> None:
+        """Test API requests get no session or CSRF cookie from middleware."""
+        response = authenticated_client.get("/api/transactions/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert not hasattr(response.wsgi_request, "session")
+        assert "csrftoken" not in response.cookies
+
+    def test_admin_login_page_uses_session_and_csrf(self) -> None:
+        """Test the admin still gets sessions, auth and a CSRF cookie."""
+        response = Client().get("/admin/login/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert hasattr(response.wsgi_request, "session")
+        assert hasattr(response.wsgi_request, "user")
+        assert "csrftoken" in response.cookies
+
+    def test_admin_post_without_csrf_token_is_rejected(self) -> None:
+        """Test CSRF protection is still enforced on admin forms."""
+        client = Client(enforce_csrf_checks=True)
+
+        response = client.post("/admin/login/", {"username": "a", "password": "b"})
+
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+
+    def test_admin_login_works(self, admin_user: User) -> None:
+        """Test staff users can still log into the admin."""
+        client = Client()
+        client.force_login(admin_user)
+
+        response = client.get("/admin/")
+
+        assert response.status_code == status.HTTP_200_OK
@@ -0,0 +1,49 @@
+"""
+Unit tests for API renderers.
+
+Tests the orjson renderer's output and its parity with DRF's JSONRenderer.
+"""
+
+from decimal import Decimal
+
+from django.utils.translation import gettext_lazy as _
+
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIClient
+
+import orjson
+import pytest
+
+from api.renderers import ORJSONRenderer
+
+
+class TestORJSONRenderer:
+    """Test suite for ORJSONRenderer."""
+
+    def test_renders_none_as_empty_body(self) -> None:
+        """Test empty responses (e.g. 204) have no body."""
+        assert ORJSONRenderer().render(None) == b""
+
+    def test_matches_drf_json_renderer(self) -> None:
+        """Test values orjson can't encode natively render like DRF does."""
+        data = {"amount": Decimal("100.50"), "detail": _("Not found."), 1: "one"}
+
+        rendered = orjson.loads(ORJSONRenderer().render(data))
+
+        assert rendered == orjson.loads(JSONRenderer().render(data))
+
+    def test_indents_when_requested(self) -> None:
+        """Test the browsable API's indent request pretty-prints output."""
+        rendered = ORJSONRenderer().render({"id": 1}, "application/json", {"indent": 4})
+
+        assert rendered == b'{\n  "id": 1\n}'
+
+    @pytest.mark.django_db
+    def test_api_responses_use_orjson_renderer(
+        self, authenticated_client: APIClient
+    ) -> None:
+        """Test JSON API responses are rendered by ORJSONRenderer."""
+        response = authenticated_client.get("/api/transactions/")
+
+        assert isinstance(response.accepted_renderer, ORJSONRenderer)
+        assert response["Content-Type"] == "application/json"
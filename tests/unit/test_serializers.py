@@ -6,8 +6,10 @@ Tests serializer validation, field configuration, and data transformation.
 
 from decimal import Decimal
 from typing import Any
+from unittest import mock
 
 from django.contrib.auth.models import User
+from django.db import transaction
 
 from rest_framework.test import APIRequestFactory
 
@@ -18,36 +20,63 @@ from api.serializers import TransactionSerializer
 from tests.factories import UserFactory
 
 
-@pytest.mark.django_db
+@pytest.fixture(scope="module")
+def request_factory() -> APIRequestFactory:
+    """Provide one request factory for the serializer tests that need a request."""
+    return APIRequestFactory()
+
+
+@pytest.fixture(scope="module")
+def empty_serializer() -> TransactionSerializer:
+    """Provide one unbound serializer for tests that only inspect its fields."""
+    return TransactionSerializer()
+
+
 class TestTransactionSerializer:
     """Test suite for TransactionSerializer."""
 
-    def test_serializer_contains_expected_fields(self) -> None:
+    def test_serializer_contains_expected_fields(
+        self, empty_serializer: TransactionSerializer
+    ) -> None:
         """Test serializer includes all expected fields."""
-        serializer = TransactionSerializer()
         expected_fields = {"id", "amount", "category", "description", "date", "user"}
 
-        assert set(serializer.fields.keys()) == expected_fields
+        assert set(empty_serializer.fields.keys()) == expected_fields
 
-    def test_serializer_read_only_fields(self) -> None:
+    def test_serializer_read_only_fields(
+        self, empty_serializer: TransactionSerializer
+    ) -> None:
         """Test id, date, and user fields are read-only."""
-        serializer = TransactionSerializer()
+        fields = empty_serializer.fields
+
+        assert fields["id"].read_only is True
+        assert fields["date"].read_only is True
+        assert fields["user"].read_only is True
 
-        assert serializer.fields["id"].read_only is True
-        assert serializer.fields["date"].read_only is True
-        assert serializer.fields["user"].read_only is True
+    def test_fields_are_declared_not_built_from_model(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test no field is generated by ModelSerializer introspection."""
+        # Force a rebuild; monkeypatch restores the shared cache afterwards
+        monkeypatch.setattr(TransactionSerializer, "_field_cache", None)
+        with mock.patch.object(TransactionSerializer, "build_field") as build_field:
+            TransactionSerializer()
 
-    def test_serialize_transaction(self, sample_transaction: Transaction) -> None:
+        build_field.assert_not_called()
+
+    @pytest.mark.django_db
+    def test_serialize_transaction(self, unsaved_transaction: Transaction) -> None:
         """Test serializing a transaction instance."""
-        serializer = TransactionSerializer(sample_transaction)
+        serializer = TransactionSerializer(unsaved_transaction)
         data = serializer.data
 
-        assert data["id"] == sample_transaction.id
-        assert Decimal(data["amount"]) == sample_transaction.amount
-        assert data["category"] == sample_transaction.category
-        assert data["description"] == sample_transaction.description
-        assert data["user"] == sample_transaction.user.id
+        assert data["id"] == unsaved_transaction.id
+        assert data["amount"] == "100.50"
+        assert data["category"] == unsaved_transaction.category
+        assert data["description"] == unsaved_transaction.description
+        assert data["user"] == unsaved_transaction.user.id
 
+    @pytest.mark.django_db
     def test_deserialize_valid_data(self, user: User) -> None:
         """Test deserializing valid transaction data."""
         data: dict[str, Any] = {
@@ -121,10 +150,12 @@ class TestTransactionSerializer:
             or serializer.validated_data["description"] in [None, ""]
         )
 
-    def test_create_assigns_user_from_request(self, user: User) -> None:
+    @pytest.mark.django_db
+    def test_create_assigns_user_from_request(
+        self, request_factory: APIRequestFactory, user: User
+    ) -> None:
         """Test create() automatically assigns user from request context."""
-        factory = APIRequestFactory()
-        request = factory.post("/api/transactions/")
+        request = request_factory.post("/api/transactions/")
         request.user = user
 
         data: dict[str, Any] = {
@@ -140,12 +171,14 @@ class TestTransactionSerializer:
         assert transaction.user == user
         assert transaction.amount == Decimal("200.00")
 
-    def test_cannot_override_user_in_data(self, user: User) -> None:
+    @pytest.mark.django_db
+    def test_cannot_override_user_in_data(
+        self, request_factory: APIRequestFactory, user: User
+    ) -> None:
         """Test user field in data is ignored (read-only)."""
         other_user = UserFactory()
 
-        factory = APIRequestFactory()
-        request = factory.post("/api/transactions/")
+        request = request_factory.post("/api/transactions/")
         request.user = user
 
         data: dict[str, Any] = {
@@ -162,6 +195,7 @@ class TestTransactionSerializer:
         assert transaction.user == user
         assert transaction.user != other_user
 
+    @pytest.mark.django_db
     def test_update_transaction(self, sample_transaction: Transaction) -> None:
         """Test updating an existing transaction."""
         data: dict[str, Any] = {
@@ -177,3 +211,47 @@ class TestTransactionSerializer:
         assert updated.id == sample_transaction.id
         assert updated.amount == Decimal("250.00")
         assert updated.category == "expense"
+
+    @pytest.mark.django_db
+    def test_create_runs_in_atomic_block(
+        self, request_factory: APIRequestFactory, user: User
+    ) -> None:
+        """Test the create write is scoped to its own atomic block."""
+        request = request_factory.post("/api/transactions/")
+        request.user = user
+        serializer = TransactionSerializer(
+            data={"amount": "10.00", "category": "expense"},
+            context={"request": request},
+        )
+        assert serializer.is_valid()
+
+        with mock.patch(
+            "api.serializers.transaction.atomic", wraps=transaction.atomic
+        ) as atomic:
+            serializer.save()
+
+        atomic.assert_called_once_with()
+
+    def test_field_map_is_cached_per_class(self) -> None:
+        """Test fields are built once per class but bound per instance."""
+        first = TransactionSerializer()
+        second = TransactionSerializer()
+
+        assert TransactionSerializer._field_cache is not None
+        assert first.fields["amount"] is not second.fields["amount"]
+        assert first.fields["amount"].parent is first
+        assert second.fields["amount"].parent is second
+
+    def test_field_cache_is_reset_for_subclasses(self) -> None:
+        """Test subclasses build their own field map."""
+        TransactionSerializer()
+
+        class AmountOnlySerializer(TransactionSerializer):
+            class Meta(TransactionSerializer.Meta):
+                """Serializer configuration."""
+
+                fields = ("id", "amount")
+
+        assert AmountOnlySerializer._field_cache is None
+        assert set(AmountOnlySerializer().fields.keys()) == {"id", "amount"}
+        assert "category" in TransactionSerializer().fields
@@ -0,0 +1,100 @@
+"""
+Unit tests for project settings.
+
+Tests the environment-driven JWT signing and database configuration, and
+the test-only overrides.
+"""
+
+import runpy
+from pathlib import Path
+from typing import Any
+
+from django.contrib.auth.hashers import MD5PasswordHasher, get_hasher
+from django.core.exceptions import ImproperlyConfigured
+from django.db import connection
+
+import pytest
+
+SETTINGS_PATH = Path(__file__).resolve().parents[2] / "config" / "settings.py"
+
+
+def _load_settings() -> dict[str, Any]:
+    """Execute config/settings.py afresh and return its namespace."""
+    return runpy.run_path(str(SETTINGS_PATH))
+
+
+class TestJWTSettings:
+    """Test suite for the SIMPLE_JWT algorithm and key selection."""
+
+    def test_hmac_is_the_default(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test tokens are signed with SECRET_KEY and HS256 by default."""
+        monkeypatch.delenv("JWT_ALGORITHM", raising=False)
+
+        namespace = _load_settings()
+
+        assert namespace["SIMPLE_JWT"]["ALGORITHM"] == "HS256"
+        assert namespace["SIMPLE_JWT"]["SIGNING_KEY"] == namespace["SECRET_KEY"]
+
+    def test_asymmetric_algorithm_reads_key_files(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test EdDSA loads the private and public keys from the key files."""
+        private_key = tmp_path / "private.pem"
+        public_key = tmp_path / "public.pem"
+        private_key.write_text("private")
+        public_key.write_text("public")
+        monkeypatch.setenv("JWT_ALGORITHM", "EdDSA")
+        monkeypatch.setenv("JWT_PRIVATE_KEY_FILE", str(private_key))
+        monkeypatch.setenv("JWT_PUBLIC_KEY_FILE", str(public_key))
+
+        simple_jwt = _load_settings()["SIMPLE_JWT"]
+
+        assert simple_jwt["ALGORITHM"] == "EdDSA"
+        assert simple_jwt["SIGNING_KEY"] == "private"
+        assert simple_jwt["VERIFYING_KEY"] == "public"
+
+    def test_missing_key_file_is_reported(
+        self, monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+    ) -> None:
+        """Test a missing key file fails fast with a configuration error."""
+        monkeypatch.setenv("JWT_ALGORITHM", "EdDSA")
+        monkeypatch.setenv("JWT_PRIVATE_KEY_FILE", str(tmp_path / "missing.pem"))
+
+        with pytest.raises(ImproperlyConfigured, match="JWT_PRIVATE_KEY_FILE"):
+            _load_settings()
+
+
+class TestDatabaseSettings:
+    """Test suite for database connection settings."""
+
+    def test_connections_persist_by_default(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test connections are reused for ten minutes unless overridden."""
+        monkeypatch.delenv("DB_CONN_MAX_AGE", raising=False)
+
+        database = _load_settings()["DATABASES"]["default"]
+
+        assert database["CONN_MAX_AGE"] == 600
+        assert database["CONN_HEALTH_CHECKS"] is True
+
+    def test_conn_max_age_from_environment(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test DB_CONN_MAX_AGE overrides the connection lifetime."""
+        monkeypatch.setenv("DB_CONN_MAX_AGE", "0")
+
+        assert _load_settings()["DATABASES"]["default"]["CONN_MAX_AGE"] == 0
+
+
+class TestTestSettings:
+    """Test suite for the test-only settings overrides."""
+
+    def test_passwords_use_fast_hasher(self) -> None:
+        """Test the suite hashes passwords with MD5, not PBKDF2."""
+        assert isinstance(get_hasher(), MD5PasswordHasher)
+
+    @pytest.mark.django_db
+    def test_database_is_in_memory(self) -> None:
+        """Test the suite's database lives in memory, not on disk."""
+        assert connection.creation.is_in_memory_db(connection.settings_dict["NAME"])
@@ -4,156 +4,197 @@ Unit tests for Swagger/OpenAPI documentation.
 Tests schema generation, endpoint documentation, and API metadata.
 """
 
+from collections.abc import Callable
 from typing import Any
+from unittest import mock
 
+from django.core.cache import cache
 from django.urls import reverse
 
 from rest_framework import status
 from rest_framework.test import APIClient
 
+import orjson
 import pytest
+from drf_yasg.generators import OpenAPISchemaGenerator
 
+from config import urls
 
-@pytest.mark.django_db
+SCHEMA_URL = "/docs/swagger.json"
+
+
+PathItem = dict[str, Any]
+
+
+def _documents_id_parameter(list_path: PathItem, detail_path: PathItem) -> bool:
+    """Check the detail endpoint documents its ``id`` path parameter, if any."""
+    params = detail_path.get("parameters")
+    return params is None or any(p.get("name") == "id" for p in params)
+
+
+# Structural properties of the OpenAPI document, checked by test_schema_shape
+SCHEMA_ASSERTIONS: list[tuple[str, Callable[[dict[str, Any]], bool]]] = [
+    ("version", lambda s: "swagger" in s or "openapi" in s),
+    ("info.title", lambda s: "Django Financial API" in s["info"]["title"]),
+    ("info.version", lambda s: "version" in s["info"]),
+    ("info.description", lambda s: "description" in s["info"]),
+    ("paths.list", lambda s: "/transactions/" in s["paths"]),
+    ("paths.detail", lambda s: "/transactions/{id}/" in s["paths"]),
+    ("security", lambda s: "securityDefinitions" in s or "components" in s),
+    ("paths.token", lambda s: "/token/" in s["paths"]),
+    ("paths.token_refresh", lambda s: "/token/refresh/" in s["paths"]),
+]
+
+# Properties of the transaction list and detail endpoints, checked by
+# test_transaction_endpoint_shape against the two path items
+ENDPOINT_ASSERTIONS: list[tuple[str, Callable[[PathItem, PathItem], bool]]] = [
+    ("list.methods", lambda list_, _: {"get", "post"} <= list_.keys()),
+    (
+        "detail.methods",
+        lambda _, detail: {"get", "put", "patch", "delete"} <= detail.keys(),
+    ),
+    (
+        "post.request_body",
+        lambda list_, _: "parameters" in list_["post"]
+        or "requestBody" in list_["post"],
+    ),
+    ("get.responses", lambda list_, _: "200" in list_["get"]["responses"]),
+    ("detail.id_parameter", _documents_id_parameter),
+]
+
+
+@pytest.fixture(scope="session")
+def swagger_schema_bytes() -> tuple[bytes, str]:
+    """
+    Fetch the generated OpenAPI document once for the whole test session.
+
+    Returns:
+        tuple[bytes, str]: The response body and its Content-Type.
+    """
+    response = APIClient().get(SCHEMA_URL)
+    assert response.status_code == status.HTTP_200_OK
+    return response.content, response["Content-Type"]
+
+
+@pytest.fixture(scope="session")
+def swagger_schema(swagger_schema_bytes: tuple[bytes, str]) -> dict[str, Any]:
+    """Provide the OpenAPI document, parsed once. Tests must not modify it."""
+    return orjson.loads(swagger_schema_bytes[0])
+
+
+@pytest.fixture(scope="session")
+def transaction_paths(swagger_schema: dict[str, Any]) -> tuple[PathItem, PathItem]:
+    """Provide the transaction list and detail path items of the schema."""
+    paths = swagger_schema["paths"]
+    return paths["/transactions/"], paths["/transactions/{id}/"]
+
+
+@pytest.fixture(scope="module")
+def swagger_ui_url() -> str:
+    """Resolve the Swagger UI URL once for this module."""
+    return reverse("schema-swagger-ui")
+
+
+@pytest.fixture(scope="module")
+def redoc_url() -> str:
+    """Resolve the ReDoc URL once for this module."""
+    return reverse("schema-redoc")
+
+
+@pytest.fixture(scope="module")
+def swagger_ui_content(swagger_ui_url: str) -> bytes:
+    """Fetch the Swagger UI page once for this module."""
+    response = APIClient().get(swagger_ui_url)
+    assert response.status_code == status.HTTP_200_OK
+    return response.content
+
+
+@pytest.mark.schema
 class TestSwaggerDocumentation:
     """Test suite for Swagger/OpenAPI documentation endpoints."""
 
-    def test_swagger_ui_accessible(self, api_client: APIClient) -> None:
+    def test_swagger_ui_accessible(self, swagger_ui_content: bytes) -> None:
         """Test that Swagger UI endpoint is accessible."""
-        url = reverse("schema-swagger-ui")
-        response = api_client.get(url)
-
-        assert response.status_code == status.HTTP_200_OK
-        assert "swagger" in response.content.decode().lower()
+        assert b"swagger" in swagger_ui_content
 
-    def test_redoc_ui_accessible(self, api_client: APIClient) -> None:
+    def test_redoc_ui_accessible(self, api_client: APIClient, redoc_url: str) -> None:
         """Test that ReDoc UI endpoint is accessible."""
-        url = reverse("schema-redoc")
-        response = api_client.get(url)
+        response = api_client.get(redoc_url)
 
         assert response.status_code == status.HTTP_200_OK
-        assert "redoc" in response.content.decode().lower()
+        assert b"redoc" in response.content
 
-    def test_swagger_json_schema_generation(self, api_client: APIClient) -> None:
-        """Test that OpenAPI JSON schema is generated correctly."""
-        url = "/swagger.json"
-        response = api_client.get(url)
-
-        assert response.status_code == status.HTTP_200_OK
-        assert "application/json" in response["Content-Type"]
-
-        schema: dict[str, Any] = response.json()
-        assert "swagger" in schema or "openapi" in schema
-        assert "info" in schema
-        assert "paths" in schema
-
-    def test_schema_contains_api_info(self, api_client: APIClient) -> None:
-        """Test that schema contains proper API information."""
-        url = "/swagger.json"
-        response = api_client.get(url)
-        schema: dict[str, Any] = response.json()
-
-        assert "info" in schema
-        info = schema["info"]
-        assert "title" in info
-        assert "Django Financial API" in info["title"]
-        assert "version" in info
-        assert "description" in info
-
-    def test_schema_contains_transaction_endpoints(self, api_client: APIClient) -> None:
-        """Test that schema includes all transaction endpoints."""
-        url = "/swagger.json"
-        response = api_client.get(url)
-        schema: dict[str, Any] = response.json()
-
-        assert "paths" in schema
-        paths = schema["paths"]
-
-        # Check that transaction endpoints exist
-        assert "/transactions/" in paths
-        assert "/transactions/{id}/" in paths
-
-    def test_schema_documents_http_methods(self, api_client: APIClient) -> None:
-        """Test that schema documents all HTTP methods for transactions."""
-        url = "/swagger.json"
-        response = api_client.get(url)
-        schema: dict[str, Any] = response.json()
-
-        transactions_list = schema["paths"]["/transactions/"]
-        transactions_detail = schema["paths"]["/transactions/{id}/"]
-
-        # List endpoint should have GET and POST
-        assert "get" in transactions_list
-        assert "post" in transactions_list
-
-        # Detail endpoint should have GET, PUT, PATCH, DELETE
-        assert "get" in transactions_detail
-        assert "put" in transactions_detail
-        assert "patch" in transactions_detail
-        assert "delete" in transactions_detail
-
-    def test_schema_includes_authentication(self, api_client: APIClient) -> None:
-        """Test that schema documents authentication requirements."""
-        url = "/swagger.json"
-        response = api_client.get(url)
-        schema: dict[str, Any] = response.json()
-
-        # Check for security definitions
-        assert (
-            "securityDefinitions" in schema or "components" in schema
-        ), "Schema should include security definitions"
-
-    def test_schema_includes_request_body_examples(self, api_client: APIClient) -> None:
-        """Test that POST/PUT endpoints include request body schemas."""
-        url = "/swagger.json"
-        response = api_client.get(url)
-        schema: dict[str, Any] = response.json()
-
-        # Check POST endpoint has request body definition
-        post_endpoint = schema["paths"]["/transactions/"]["post"]
-        assert (
-            "parameters" in post_endpoint or "requestBody" in post_endpoint
-        ), "POST endpoint should define request body"
-
-    def test_schema_includes_response_schemas(self, api_client: APIClient) -> None:
-        """Test that endpoints include response schema definitions."""
-        url = "/swagger.json"
-        response = api_client.get(url)
-        schema: dict[str, Any] = response.json()
-
-        get_endpoint = schema["paths"]["/transactions/"]["get"]
-        assert "responses" in get_endpoint
-        assert "200" in get_endpoint["responses"]
-
-    def test_schema_includes_authentication_endpoints(
-        self, api_client: APIClient
+    def test_docs_views_are_built_once(
+        self, api_client: APIClient, redoc_url: str
     ) -> None:
-        """Test that JWT authentication endpoints are documented."""
-        url = "/swagger.json"
-        response = api_client.get(url)
-        schema: dict[str, Any] = response.json()
+        """Test the schema view is built on first request and then reused."""
+        urls._build_docs_view.cache_clear()
+
+        api_client.get(redoc_url)
+        api_client.get(redoc_url)
+
+        assert urls._build_docs_view.cache_info().misses == 1
+        assert urls.docs_view("redoc").csrf_exempt is True  # type: ignore[attr-defined]
+
+    def test_schema_is_cached(self, api_client: APIClient) -> None:
+        """Test the generated schema is cached instead of rebuilt per request."""
+        cache.clear()
+        with mock.patch.object(
+            OpenAPISchemaGenerator,
+            "get_schema",
+            autospec=True,
+            side_effect=OpenAPISchemaGenerator.get_schema,
+        ) as get_schema:
+            first = api_client.get(SCHEMA_URL)
+            second = api_client.get(SCHEMA_URL)
+
+        assert get_schema.call_count == 1
+        assert first.content == second.content
+
+    def test_swagger_json_schema_generation(
+        self, swagger_schema_bytes: tuple[bytes, str]
+    ) -> None:
+        """Test that the OpenAPI schema is served as JSON."""
+        _content, content_type = swagger_schema_bytes
+
+        assert "application/json" in content_type
 
-        paths = schema["paths"]
-        assert "/token/" in paths
-        assert "/token/refresh/" in paths
+    def test_swagger_json_is_not_indented(
+        self, swagger_schema_bytes: tuple[bytes, str]
+    ) -> None:
+        """Test the schema is served without pretty-printing whitespace."""
+        content, _content_type = swagger_schema_bytes
+
+        assert b"\n" not in content
+
+    @pytest.mark.parametrize(
+        ("name", "check"),
+        SCHEMA_ASSERTIONS,
+        ids=[name for name, _ in SCHEMA_ASSERTIONS],
+    )
+    def test_schema_shape(
+        self,
+        swagger_schema: dict[str, Any],
+        name: str,
+        check: Callable[[dict[str, Any]], bool],
+    ) -> None:
+        """Test one structural property of the generated schema."""
+        assert check(swagger_schema), f"Schema check failed: {name}"
+
+    @pytest.mark.parametrize(
+        ("name", "check"),
+        ENDPOINT_ASSERTIONS,
+        ids=[name for name, _ in ENDPOINT_ASSERTIONS],
+    )
+    def test_transaction_endpoint_shape(
+        self,
+        transaction_paths: tuple[PathItem, PathItem],
+        name: str,
+        check: Callable[[PathItem, PathItem], bool],
+    ) -> None:
+        """Test one property of the documented transaction endpoints."""
+        assert check(*transaction_paths), f"Endpoint check failed: {name}"
 
-    def test_swagger_ui_contains_api_title(self, api_client: APIClient) -> None:
+    def test_swagger_ui_contains_api_title(self, swagger_ui_content: bytes) -> None:
         """Test that Swagger UI displays the API title."""
-        url = reverse("schema-swagger-ui")
-        response = api_client.get(url)
-        content = response.content.decode()
-
-        assert "Django Financial API" in content
-
-    def test_schema_parameter_descriptions(self, api_client: APIClient) -> None:
-        """Test that schema includes parameter descriptions."""
-        url = "/swagger.json"
-        response = api_client.get(url)
-        schema: dict[str, Any] = response.json()
-
-        # Check detail endpoint has id parameter documented
-        detail_path = schema["paths"]["/transactions/{id}/"]
-        if "parameters" in detail_path:
-            params = detail_path["parameters"]
-            id_param = next((p for p in params if p.get("name") == "id"), None)
-            assert id_param is not None, "ID parameter should be documented"
+        assert b"Django Financial API" in swagger_ui_content
@@ -0,0 +1,157 @@
+"""
+Unit tests for API throttling.
+
+Tests the Redis token-bucket path and the fallback to DRF's cache throttle.
+"""
+
+from typing import Any
+from unittest import mock
+
+from django.contrib.auth.models import User
+from django.core.cache import caches
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.settings import api_settings
+from rest_framework.test import APIClient, APIRequestFactory
+from rest_framework.throttling import UserRateThrottle
+
+import pytest
+
+from api import throttling
+from api.throttling import (
+    AnonThrottle,
+    TransactionAnonThrottle,
+    TransactionUserThrottle,
+    UserThrottle,
+    parse_rate,
+)
+
+
+class FakeRedis:
+    """Minimal stand-in for a Redis client running the token-bucket script."""
+
+    def __init__(self) -> None:
+        self.tokens: dict[str, float] = {}
+
+    def eval(
+        self, script: str, numkeys: int, key: str, capacity: int, rate: float
+    ) -> list[Any]:
+        """Take a token from the key's bucket the way the Lua script does."""
+        tokens = self.tokens.get(key, capacity)
+        if tokens >= 1:
+            self.tokens[key] = tokens - 1
+            return [1, "0"]
+        self.tokens[key] = tokens
+        return [0, str((1 - tokens) / rate)]
+
+
+def _user_request(user: User) -> Any:
+    """Build a request authenticated as the given user."""
+    request = APIRequestFactory().get("/api/transactions/")
+    request.user = user
+    return request
+
+
+class TestRedisRateThrottle:
+    """Test suite for RedisRateThrottle."""
+
+    def test_takes_tokens_from_redis_bucket(self, user: User) -> None:
+        """Test an empty bucket rejects requests until the next token."""
+        redis = FakeRedis()
+        request = _user_request(user)
+
+        with mock.patch.object(throttling, "get_redis_connection", return_value=redis):
+            throttle = TransactionUserThrottle()
+            throttle.num_requests, throttle.duration = 2, 60
+            results = [throttle.allow_request(request, None) for _ in range(3)]
+
+        assert results == [True, True, False]
+        assert throttle.wait() == 30.0
+        assert redis.tokens == {throttle.key: 0}
+
+    def test_skips_requests_without_cache_key(self, user: User) -> None:
+        """Test the anonymous throttle ignores authenticated requests."""
+        redis = FakeRedis()
+
+        with mock.patch.object(throttling, "get_redis_connection", return_value=redis):
+            allowed = TransactionAnonThrottle().allow_request(_user_request(user), None)
+
+        assert allowed is True
+        assert redis.tokens == {}
+
+    def test_falls_back_without_django_redis_cache(self, user: User) -> None:
+        """Test non-Redis cache backends use DRF's default throttle."""
+        throttle = TransactionUserThrottle()
+
+        assert throttle.get_redis() is None
+        assert throttle.allow_request(_user_request(user), None) is True
+
+    def test_fallback_when_cache_is_not_redis(self) -> None:
+        """Test a django-redis import with a non-Redis cache falls back."""
+        with mock.patch.object(
+            throttling,
+            "get_redis_connection",
+            side_effect=NotImplementedError,
+        ):
+            assert TransactionUserThrottle().get_redis() is None
+
+    def test_fallback_uses_throttle_cache(self, user: User) -> None:
+        """Test DRF's default algorithm keeps its history in the throttle cache."""
+        throttle = UserThrottle()
+        throttle.allow_request(_user_request(user), None)
+
+        assert len(caches["throttle"].get(throttle.key)) == 1
+
+    def test_scope_throttles_use_default_rates(self) -> None:
+        """Test the opt-in throttles read the anon and user scopes."""
+        assert (AnonThrottle().num_requests, AnonThrottle().duration) == (10, 60)
+        assert (UserThrottle().num_requests, UserThrottle().duration) == (
+            1000,
+            86400,
+        )
+
+
+class TestParseRate:
+    """Test suite for the cached rate parser."""
+
+    def test_parses_rate_strings(self) -> None:
+        """Test rate strings are parsed like DRF does."""
+        assert parse_rate("500/day") == (500, 86400)
+        assert parse_rate("5/minute") == (5, 60)
+        assert parse_rate(None) == (None, None)
+
+    @pytest.mark.parametrize("rate", ["3/s", "10/min", "7/hour", "1000/day"])
+    def test_matches_drf_parse_rate(self, rate: str) -> None:
+        """Test every period spelling parses as DRF would."""
+        assert parse_rate(rate) == UserRateThrottle().parse_rate(rate)
+
+    def test_throttles_reuse_the_parsed_rate(self) -> None:
+        """Test instantiating a throttle does not re-parse its rate."""
+        TransactionUserThrottle()
+        hits = parse_rate.cache_info().hits
+
+        throttle = TransactionUserThrottle()
+
+        assert parse_rate.cache_info().hits == hits + 1
+        assert (throttle.num_requests, throttle.duration) == (500, 86400)
+
+
+@pytest.mark.django_db
+class TestThrottleScope:
+    """Test suite for which endpoints are throttled."""
+
+    def test_no_throttles_apply_by_default(self) -> None:
+        """Test only views that declare throttle classes are rate limited."""
+        assert api_settings.DEFAULT_THROTTLE_CLASSES == []
+
+    def test_token_endpoint_is_not_anon_throttled(self, api_client: APIClient) -> None:
+        """Test logins beyond the anon rate are not rejected with 429."""
+        credentials = {"username": "nobody", "password": "wrong"}
+
+        statuses = {
+            api_client.post(reverse("token_obtain_pair"), credentials).status_code
+            for _ in range(AnonThrottle().num_requests + 1)  # type: ignore[operator]
+        }
+
+        assert statuses == {status.HTTP_401_UNAUTHORIZED}
@@ -0,0 +1,40 @@
+"""
+Unit tests for the project URL configuration.
+
+Tests that the JWT token views are imported lazily.
+"""
+
+from django.contrib.auth.models import User
+from django.urls import reverse
+
+from rest_framework import status
+from rest_framework.test import APIClient
+
+import pytest
+from rest_framework_simplejwt.views import TokenRefreshView
+
+from config import urls
+
+
+@pytest.mark.django_db
+class TestLazyTokenViews:
+    """Test suite for the lazily imported token endpoints."""
+
+    def test_token_view_is_built_once(self, api_client: APIClient, user: User) -> None:
+        """Test the token view is imported on first request and then reused."""
+        urls._build_lazy_view.cache_clear()
+        credentials = {"username": "testuser", "password": "testpass123"}
+
+        first = api_client.post(reverse("token_obtain_pair"), credentials)
+        second = api_client.post(reverse("token_obtain_pair"), credentials)
+
+        assert first.status_code == second.status_code == status.HTTP_200_OK
+        assert urls._build_lazy_view.cache_info().misses == 1
+
+    def test_lazy_view_looks_like_as_view(self) -> None:
+        """Test the wrapper exposes what CSRF and schema generation read."""
+        view = urls.LazyView("rest_framework_simplejwt.views.TokenRefreshView")
+
+        assert view.csrf_exempt is True
+        assert view.cls is TokenRefreshView
+        assert view.initkwargs == {}
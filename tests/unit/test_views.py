@@ -4,49 +4,94 @@ Unit tests for Transaction ViewSet.
 Tests API endpoints, permissions, authentication, and user isolation.
 """
 
+import time
+from datetime import timedelta
 from decimal import Decimal
 from typing import Any
 
-from django.contrib.auth.models import User
+from django.contrib.auth.models import AnonymousUser, User
+from django.utils.http import http_date
 
 from rest_framework import status
-from rest_framework.test import APIClient
+from rest_framework.response import Response
+from rest_framework.test import APIClient, APIRequestFactory, force_authenticate
 
 import pytest
 
 from api.models import Transaction
-from tests.factories import TransactionFactory, UserFactory
+from api.serializers import TransactionSerializer
+from api.throttling import TransactionAnonThrottle, TransactionUserThrottle
+from api.views import TransactionViewSet
+from tests.factories import TransactionFactory, UserFactory, make_transactions
+
+# Starting amount of the transactions the update tests modify.
+ORIGINAL_AMOUNT = Decimal("100.00")
+
+# The create action as a plain view, for tests that exercise validation only
+# and don't need the URL resolver or middleware.
+create_view = TransactionViewSet.as_view({"post": "create"})
+
+
+@pytest.fixture(scope="module")
+def request_factory() -> APIRequestFactory:
+    """Provide one request factory for the view tests that bypass the client."""
+    return APIRequestFactory()
+
+
+def _create(
+    request_factory: APIRequestFactory, user: User, data: dict[str, Any]
+) -> Response:
+    """POST ``data`` to the create action directly, authenticated as ``user``."""
+    request = request_factory.post("/api/transactions/", data)
+    force_authenticate(request, user=user)
+    return create_view(request)
 
 
 @pytest.mark.django_db
 class TestTransactionViewSet:
     """Test suite for TransactionViewSet API endpoints."""
 
-    def test_list_transactions_requires_authentication(
-        self, api_client: APIClient
+    @pytest.mark.parametrize(
+        ("method", "path"),
+        [
+            ("get", "/api/transactions/"),
+            ("post", "/api/transactions/"),
+            ("get", "/api/transactions/1/"),
+            ("put", "/api/transactions/1/"),
+            ("patch", "/api/transactions/1/"),
+            ("delete", "/api/transactions/1/"),
+        ],
+        ids=["list", "create", "retrieve", "update", "partial_update", "delete"],
+    )
+    def test_transaction_endpoints_require_authentication(
+        self, api_client: APIClient, method: str, path: str
     ) -> None:
-        """Test that listing transactions requires authentication."""
-        response = api_client.get("/api/transactions/")
+        """Test that every transaction endpoint rejects anonymous requests."""
+        # Permissions are checked before the object lookup, so the detail
+        # routes don't need a saved transaction to answer 401
+        response = getattr(api_client, method)(path)
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
     def test_list_transactions_returns_only_user_transactions(
-        self, authenticated_client: APIClient, user: User
+        self,
+        authenticated_client: APIClient,
+        user: User,
+        django_assert_num_queries: Any,
     ) -> None:
         """Test that users can only see their own transactions."""
         # Create transactions for authenticated user
-        user_transaction1 = TransactionFactory(user=user, amount=Decimal("100.00"))
-        user_transaction2 = TransactionFactory(user=user, amount=Decimal("200.00"))
+        user_transaction1, user_transaction2 = make_transactions(user, 2)
 
         # Create transactions for another user
-        other_user = UserFactory()
-        TransactionFactory(user=other_user, amount=Decimal("300.00"))
-        TransactionFactory(user=other_user, amount=Decimal("400.00"))
+        make_transactions(UserFactory(), 2)
 
-        response = authenticated_client.get("/api/transactions/")
+        # User lookup, ETag validators and page; no query per row
+        with django_assert_num_queries(3):
+            response = authenticated_client.get("/api/transactions/")
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 2  # type: ignore[arg-type]
-        transaction_ids = [t["id"] for t in response.data]  # type: ignore[union-attr]
+        assert len(response.data["results"]) == 2  # type: ignore[arg-type]
+        transaction_ids = [t["id"] for t in response.data["results"]]  # type: ignore[union-attr]
         assert user_transaction1.id in transaction_ids
         assert user_transaction2.id in transaction_ids
 
@@ -61,16 +106,7 @@ class TestTransactionViewSet:
         response = authenticated_client.get("/api/transactions/")
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 0  # type: ignore[arg-type]
-
-    def test_retrieve_transaction_requires_authentication(
-        self, api_client: APIClient, user: User
-    ) -> None:
-        """Test that retrieving a transaction requires authentication."""
-        transaction = TransactionFactory(user=user)
-
-        response = api_client.get(f"/api/transactions/{transaction.id}/")
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert len(response.data["results"]) == 0  # type: ignore[arg-type]
 
     def test_retrieve_own_transaction_success(
         self, authenticated_client: APIClient, user: User
@@ -84,7 +120,7 @@ class TestTransactionViewSet:
 
         assert response.status_code == status.HTTP_200_OK
         assert response.data["id"] == transaction.id  # type: ignore[index]
-        assert Decimal(response.data["amount"]) == Decimal("150.75")  # type: ignore[index]
+        assert response.data["amount"] == "150.75"  # type: ignore[index]
         assert response.data["category"] == "income"  # type: ignore[index]
         assert response.data["description"] == "Salary"  # type: ignore[index]
 
@@ -101,19 +137,6 @@ class TestTransactionViewSet:
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
 
-    def test_create_transaction_requires_authentication(
-        self, api_client: APIClient
-    ) -> None:
-        """Test that creating a transaction requires authentication."""
-        data: dict[str, Any] = {
-            "amount": "100.00",
-            "category": "income",
-            "description": "Test",
-        }
-
-        response = api_client.post("/api/transactions/", data)
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
     def test_create_transaction_success(
         self, authenticated_client: APIClient, user: User
     ) -> None:
@@ -127,13 +150,12 @@ class TestTransactionViewSet:
         response = authenticated_client.post("/api/transactions/", data)
 
         assert response.status_code == status.HTTP_201_CREATED
-        assert Decimal(response.data["amount"]) == Decimal("250.50")  # type: ignore[index]
+        assert response.data["amount"] == "250.50"  # type: ignore[index]
         assert response.data["category"] == "expense"  # type: ignore[index]
         assert response.data["description"] == "Office supplies"  # type: ignore[index]
         assert response.data["user"] == user.id  # type: ignore[index]
-
-        # Verify transaction was created in database
-        assert Transaction.objects.filter(user=user, amount=Decimal("250.50")).exists()
+        # The primary key is only assigned once the row is saved
+        assert isinstance(response.data["id"], int)  # type: ignore[index]
 
     def test_create_transaction_auto_assigns_user(
         self, authenticated_client: APIClient, user: User
@@ -154,36 +176,26 @@ class TestTransactionViewSet:
         assert response.data["user"] == user.id  # type: ignore[index]
         assert response.data["user"] != other_user.id  # type: ignore[index]
 
-    def test_create_transaction_missing_amount(
-        self, authenticated_client: APIClient
-    ) -> None:
-        """Test that creating transaction without amount fails."""
-        data: dict[str, Any] = {
-            "category": "income",
-            "description": "Test",
-        }
-
-        response = authenticated_client.post("/api/transactions/", data)
-
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert "amount" in response.data  # type: ignore[operator]
-
-    def test_create_transaction_missing_category(
-        self, authenticated_client: APIClient
+    @pytest.mark.parametrize("missing", ["amount", "category"])
+    def test_create_transaction_missing_required_field(
+        self, request_factory: APIRequestFactory, user: User, missing: str
     ) -> None:
-        """Test that creating transaction without category fails."""
+        """Test that creating a transaction without a required field fails."""
         data: dict[str, Any] = {
             "amount": "100.00",
+            "category": "income",
             "description": "Test",
         }
+        del data[missing]
 
-        response = authenticated_client.post("/api/transactions/", data)
+        response = _create(request_factory, user, data)
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert "category" in response.data  # type: ignore[operator]
+        # The error body names the missing field and nothing else
+        assert response.data.keys() == {missing}  # type: ignore[union-attr]
 
     def test_create_transaction_invalid_category(
-        self, authenticated_client: APIClient
+        self, request_factory: APIRequestFactory, user: User
     ) -> None:
         """Test that creating transaction with invalid category fails."""
         data: dict[str, Any] = {
@@ -192,27 +204,17 @@ class TestTransactionViewSet:
             "description": "Test",
         }
 
-        response = authenticated_client.post("/api/transactions/", data)
+        response = _create(request_factory, user, data)
 
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert "category" in response.data  # type: ignore[operator]
 
-    def test_update_transaction_requires_authentication(
-        self, api_client: APIClient, user: User
-    ) -> None:
-        """Test that updating a transaction requires authentication."""
-        transaction = TransactionFactory(user=user)
-        data: dict[str, Any] = {"amount": "200.00"}
-
-        response = api_client.put(f"/api/transactions/{transaction.id}/", data)
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
     def test_update_own_transaction_success(
         self, authenticated_client: APIClient, user: User
     ) -> None:
         """Test successful update of own transaction."""
         transaction = TransactionFactory(
-            user=user, amount=Decimal("100.00"), category="income"
+            user=user, amount=ORIGINAL_AMOUNT, category="income"
         )
 
         data: dict[str, Any] = {
@@ -226,15 +228,10 @@ class TestTransactionViewSet:
         )
 
         assert response.status_code == status.HTTP_200_OK
-        assert Decimal(response.data["amount"]) == Decimal("150.00")  # type: ignore[index]
+        assert response.data["amount"] == "150.00"  # type: ignore[index]
         assert response.data["category"] == "expense"  # type: ignore[index]
         assert response.data["description"] == "Updated description"  # type: ignore[index]
 
-        # Verify in database
-        transaction.refresh_from_db()
-        assert transaction.amount == Decimal("150.00")
-        assert transaction.category == "expense"
-
     def test_update_other_user_transaction_forbidden(
         self, authenticated_client: APIClient
     ) -> None:
@@ -259,7 +256,7 @@ class TestTransactionViewSet:
         """Test partial update (PATCH) of own transaction."""
         transaction = TransactionFactory(
             user=user,
-            amount=Decimal("100.00"),
+            amount=ORIGINAL_AMOUNT,
             category="income",
             description="Original",
         )
@@ -272,19 +269,26 @@ class TestTransactionViewSet:
         )
 
         assert response.status_code == status.HTTP_200_OK
-        assert Decimal(response.data["amount"]) == Decimal("200.00")  # type: ignore[index]
+        assert response.data["amount"] == "200.00"  # type: ignore[index]
         # Other fields should remain unchanged
         assert response.data["category"] == "income"  # type: ignore[index]
         assert response.data["description"] == "Original"  # type: ignore[index]
 
-    def test_delete_transaction_requires_authentication(
-        self, api_client: APIClient, user: User
+    def test_partial_update_writes_updated_at(
+        self, authenticated_client: APIClient, user: User
     ) -> None:
-        """Test that deleting a transaction requires authentication."""
+        """Test API writes save full rows, so auto_now columns are updated."""
         transaction = TransactionFactory(user=user)
+        Transaction.objects.filter(pk=transaction.pk).update(
+            updated_at=transaction.updated_at - timedelta(days=1)
+        )
 
-        response = api_client.delete(f"/api/transactions/{transaction.id}/")
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        authenticated_client.patch(
+            f"/api/transactions/{transaction.id}/", {"amount": "200.00"}
+        )
+
+        saved = Transaction.objects.only("updated_at").get(pk=transaction.pk)
+        assert saved.updated_at >= transaction.updated_at
 
     def test_delete_own_transaction_success(
         self, authenticated_client: APIClient, user: User
@@ -297,7 +301,7 @@ class TestTransactionViewSet:
 
         assert response.status_code == status.HTTP_204_NO_CONTENT
         # Verify transaction is deleted from database
-        assert not Transaction.objects.filter(id=transaction_id).exists()
+        assert transaction_id not in Transaction.objects.in_bulk([transaction_id])
 
     def test_delete_other_user_transaction_forbidden(
         self, authenticated_client: APIClient
@@ -311,29 +315,71 @@ class TestTransactionViewSet:
 
         assert response.status_code == status.HTTP_404_NOT_FOUND
         # Verify transaction still exists
-        assert Transaction.objects.filter(id=transaction_id).exists()
+        assert transaction_id in Transaction.objects.in_bulk([transaction_id])
 
     def test_list_transactions_with_multiple_users(
-        self, authenticated_client: APIClient, user: User
+        self,
+        authenticated_client: APIClient,
+        user: User,
+        django_assert_num_queries: Any,
     ) -> None:
         """Test that user isolation works correctly with multiple users."""
         # Create 3 transactions for authenticated user
-        TransactionFactory.create_batch(3, user=user)
+        make_transactions(user, 3)
 
         # Create 5 transactions for other users
-        user2 = UserFactory()
-        user3 = UserFactory()
-        TransactionFactory.create_batch(2, user=user2)
-        TransactionFactory.create_batch(3, user=user3)
+        make_transactions(UserFactory(), 2)
+        make_transactions(UserFactory(), 3)
 
-        response = authenticated_client.get("/api/transactions/")
+        # User lookup, ETag validators and page; no query per row
+        with django_assert_num_queries(3):
+            response = authenticated_client.get("/api/transactions/")
 
         assert response.status_code == status.HTTP_200_OK
-        assert len(response.data) == 3  # type: ignore[arg-type]
+        assert len(response.data["results"]) == 3  # type: ignore[arg-type]
         # Verify all returned transactions belong to authenticated user
-        for transaction_data in response.data:  # type: ignore[union-attr]
+        for transaction_data in response.data["results"]:  # type: ignore[union-attr]
             assert transaction_data["user"] == user.id
 
+    def test_list_transactions_is_cursor_paginated(
+        self, authenticated_client: APIClient, user: User
+    ) -> None:
+        """Test that listings are cursor-paginated newest first."""
+        transactions = make_transactions(user, 3)
+
+        response = authenticated_client.get("/api/transactions/?page_size=2")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["previous"] is None  # type: ignore[index]
+        first_page = [t["id"] for t in response.data["results"]]  # type: ignore[index]
+        assert first_page == [transactions[2].id, transactions[1].id]
+
+        next_response = authenticated_client.get(response.data["next"])  # type: ignore[index]
+
+        assert next_response.status_code == status.HTTP_200_OK
+        assert next_response.data["next"] is None  # type: ignore[index]
+        second_page = [t["id"] for t in next_response.data["results"]]  # type: ignore[index]
+        assert second_page == [transactions[0].id]
+
+    def test_cursor_pages_past_offset_cutoff_for_same_day_rows(
+        self, authenticated_client: APIClient, user: User
+    ) -> None:
+        """Test every same-day row is listed exactly once past 1000 rows."""
+        transactions = make_transactions(user, 1200)
+        listed: list[int] = []
+        url: str | None = "/api/transactions/?page_size=100"
+
+        # Bounded so a cursor that never advances fails instead of hanging
+        for _ in range(20):
+            if url is None:
+                break
+            response = authenticated_client.get(url)
+            listed.extend(t["id"] for t in response.data["results"])  # type: ignore[index]
+            url = response.data["next"]  # type: ignore[index]
+
+        assert url is None
+        assert sorted(listed) == sorted(t.id for t in transactions)
+
     def test_transaction_date_is_auto_set(
         self, authenticated_client: APIClient
     ) -> None:
@@ -369,3 +415,222 @@ class TestTransactionViewSet:
         assert response.status_code == status.HTTP_200_OK
         assert response.data["id"] == original_id  # type: ignore[index]
         assert response.data["id"] != 99999  # type: ignore[index]
+
+    def test_bulk_create_transactions_success(
+        self, authenticated_client: APIClient, user: User
+    ) -> None:
+        """Test that a list of transactions is created in one request."""
+        data = [
+            {"amount": "10.00", "category": "expense", "description": "Coffee"},
+            {"amount": "2500.00", "category": "income"},
+        ]
+
+        response = authenticated_client.post(
+            "/api/transactions/bulk/", data, format="json"
+        )
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert [t["amount"] for t in response.data] == ["10.00", "2500.00"]  # type: ignore[union-attr]
+        assert Transaction.objects.filter(user=user).count() == 2
+
+    def test_bulk_create_is_all_or_nothing(
+        self, authenticated_client: APIClient, user: User
+    ) -> None:
+        """Test that one invalid item rejects the whole batch."""
+        data = [
+            {"amount": "10.00", "category": "expense"},
+            {"amount": "10.00", "category": "invalid"},
+        ]
+
+        response = authenticated_client.post(
+            "/api/transactions/bulk/", data, format="json"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not Transaction.objects.filter(user=user).exists()
+
+    def test_bulk_create_rejects_oversized_batch(
+        self, authenticated_client: APIClient, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that batches above the item limit are rejected."""
+        monkeypatch.setattr(TransactionViewSet, "bulk_create_max_items", 1)
+        data = [{"amount": "1.00", "category": "expense"}] * 2
+
+        response = authenticated_client.post(
+            "/api/transactions/bulk/", data, format="json"
+        )
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_list_transactions_matches_serializer_output(
+        self, authenticated_client: APIClient, user: User
+    ) -> None:
+        """Test the values()-based listing renders rows like the serializer."""
+        TransactionFactory(user=user, amount=Decimal("0"), description=None)
+        TransactionFactory(user=user, amount=Decimal("1234.5"))
+
+        response = authenticated_client.get("/api/transactions/")
+
+        expected = TransactionSerializer(
+            Transaction.objects.filter(user=user), many=True
+        ).data
+        assert response.data["results"] == expected  # type: ignore[index]
+
+    def test_list_transactions_without_pagination(
+        self,
+        authenticated_client: APIClient,
+        user: User,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test the listing returns a bare list when pagination is disabled."""
+        monkeypatch.setattr(TransactionViewSet, "pagination_class", None)
+        TransactionFactory(user=user)
+
+        response = authenticated_client.get("/api/transactions/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data) == 1  # type: ignore[arg-type]
+
+    def test_list_transactions_sets_etag(
+        self, authenticated_client: APIClient, user: User
+    ) -> None:
+        """Test the listing carries an ETag but no Last-Modified header."""
+        TransactionFactory(user=user)
+
+        response = authenticated_client.get("/api/transactions/")
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"].startswith('"')
+        assert "Last-Modified" not in response
+
+    def test_list_transactions_if_modified_since_after_delete(
+        self, authenticated_client: APIClient, user: User
+    ) -> None:
+        """Test If-Modified-Since alone never yields a stale 304 after a delete."""
+        kept, deleted = make_transactions(user, 2)
+        # A date no older than any row, as a client polling after the last
+        # write would send
+        since = http_date(time.time() + 60)
+        deleted.delete()
+
+        response = authenticated_client.get(
+            "/api/transactions/", HTTP_IF_MODIFIED_SINCE=since
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert [t["id"] for t in response.data["results"]] == [kept.id]  # type: ignore[union-attr]
+
+    def test_list_transactions_not_modified_for_matching_etag(
+        self, authenticated_client: APIClient, user: User
+    ) -> None:
+        """Test a matching If-None-Match returns 304 without a body."""
+        TransactionFactory(user=user)
+        etag = authenticated_client.get("/api/transactions/")["ETag"]
+
+        response = authenticated_client.get(
+            "/api/transactions/", HTTP_IF_NONE_MATCH=etag
+        )
+
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+
+    def test_list_transactions_etag_changes_with_data(
+        self, authenticated_client: APIClient, user: User
+    ) -> None:
+        """Test creating, editing or deleting through the API changes the ETag."""
+        transaction = TransactionFactory(user=user)
+        etags = [authenticated_client.get("/api/transactions/")["ETag"]]
+
+        other = TransactionFactory(user=user)
+        etags.append(authenticated_client.get("/api/transactions/")["ETag"])
+        authenticated_client.patch(
+            f"/api/transactions/{transaction.id}/", {"description": "Edited"}
+        )
+        etags.append(authenticated_client.get("/api/transactions/")["ETag"])
+        authenticated_client.delete(f"/api/transactions/{other.id}/")
+        etags.append(authenticated_client.get("/api/transactions/")["ETag"])
+
+        assert len(set(etags)) == len(etags)
+
+    def test_list_transactions_stale_etag_after_api_edit(
+        self, authenticated_client: APIClient, user: User
+    ) -> None:
+        """Test an edit through the API invalidates the previous ETag."""
+        transaction = TransactionFactory(user=user)
+        etag = authenticated_client.get("/api/transactions/")["ETag"]
+
+        authenticated_client.patch(
+            f"/api/transactions/{transaction.id}/", {"description": "Edited"}
+        )
+        response = authenticated_client.get(
+            "/api/transactions/", HTTP_IF_NONE_MATCH=etag
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["results"][0]["description"] == "Edited"  # type: ignore[index]
+
+    def test_list_transactions_etag_is_per_user(self, api_client: APIClient) -> None:
+        """Test two users with empty listings get different ETags."""
+        etags = set()
+        for user in UserFactory.create_batch(2):
+            api_client.force_authenticate(user=user)
+            etags.add(api_client.get("/api/transactions/")["ETag"])
+
+        assert len(etags) == 2
+
+    def test_authenticated_requests_skip_anon_throttle(self, user: User) -> None:
+        """Test only the user throttle is instantiated for authenticated users."""
+        viewset = TransactionViewSet()
+        viewset.request = APIRequestFactory().get("/api/transactions/")
+        viewset.request.user = user
+
+        throttles = viewset.get_throttles()
+
+        assert [type(t) for t in throttles] == [TransactionUserThrottle]
+
+    def test_anonymous_requests_keep_all_throttles(self) -> None:
+        """Test anonymous requests are checked against every throttle."""
+        viewset = TransactionViewSet()
+        viewset.request = APIRequestFactory().get("/api/transactions/")
+        viewset.request.user = AnonymousUser()
+
+        throttles = viewset.get_throttles()
+
+        assert [type(t) for t in throttles] == [
+            TransactionUserThrottle,
+            TransactionAnonThrottle,
+        ]
+
+    def test_list_transactions_returns_all_user_rows(
+        self,
+        authenticated_client: APIClient,
+        multiple_transactions: list[Transaction],
+    ) -> None:
+        """Test every transaction created for the user is listed."""
+        response = authenticated_client.get("/api/transactions/")
+
+        listed = {t["id"] for t in response.data["results"]}  # type: ignore[union-attr]
+        assert listed == {t.pk for t in multiple_transactions}
+
+    def test_create_transaction_rejects_form_encoded_body(
+        self, authenticated_client: APIClient
+    ) -> None:
+        """Test only JSON request bodies are accepted."""
+        response = authenticated_client.post(
+            "/api/transactions/",
+            {"amount": "10.00", "category": "expense"},
+            format="multipart",
+        )
+
+        assert response.status_code == status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+
+    def test_create_transaction_rejects_oversized_body(
+        self, authenticated_client: APIClient
+    ) -> None:
+        """Test request bodies above DATA_UPLOAD_MAX_MEMORY_SIZE are refused."""
+        data = {"amount": "10.00", "category": "expense", "description": "x" * 2**20}
+
+        response = authenticated_client.post("/api/transactions/", data)
+
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not Transaction.objects.exists()